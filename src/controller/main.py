@@ -82,6 +82,7 @@ def main():
         username=config.mqtt.username if config.mqtt.username else None,
         password=config.mqtt.password if config.mqtt.password else None,
         keepalive=config.mqtt.keepalive,
+        use_msgpack=config.mqtt.use_msgpack,
     )
 
     # Create controller
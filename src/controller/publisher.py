@@ -127,8 +127,7 @@ class MatchPublisher:
             turn_roll: Turn roll data (type and value)
         """
         topic = Topics.player_topic(Topics.PLAYER_TURN_ROLL, player_id)
-        payload = {"roll_type": turn_roll.roll_type.value, "value": turn_roll.value}
-        self.mqtt.publish(topic, payload, qos=1, retain=True)
+        self.mqtt.publish(topic, turn_roll, qos=1, retain=True)
         logger.debug(
             f"Published player {player_id} turn roll: {turn_roll.roll_type.value}={turn_roll.value}"
         )
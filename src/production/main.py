@@ -81,6 +81,7 @@ def main() -> int:
         username=config.mqtt.username if config.mqtt.username else None,
         password=config.mqtt.password if config.mqtt.password else None,
         keepalive=config.mqtt.keepalive,
+        use_msgpack=config.mqtt.use_msgpack,
     )
 
     # Create state manager
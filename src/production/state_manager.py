@@ -5,10 +5,18 @@ Maintains local MatchState and notifies UI of changes.
 """
 
 import logging
+import sys
 from collections.abc import Callable
 
 from ..shared.database import DatabaseService
-from ..shared.models import Card, MatchState, PlayerState, RollType, TurnRoll
+from ..shared.models import (
+    ROLL_TYPE_BY_VALUE,
+    Card,
+    MatchState,
+    PlayerState,
+    RollType,
+    TurnRoll,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -123,6 +131,8 @@ class ProductionStateManager:
             uuid: Competitor card UUID
         """
         player = self._get_player(player_id)
+        if uuid:
+            uuid = sys.intern(uuid)
         player.competitor_uuid = uuid
 
         # Load competitor card from database
@@ -153,25 +163,27 @@ class ProductionStateManager:
         player.deck_count = count
         self._notify_ui("player_deck_count", {"player_id": player_id, "count": count})
 
-    def update_player_turn_roll(self, player_id: int, roll_data: dict) -> None:
+    def update_player_turn_roll(self, player_id: int, roll_data: TurnRoll | dict) -> None:
         """
         Update player turn roll.
 
         Args:
             player_id: Player ID (1 or 2)
-            roll_data: Dict with 'roll_type' and 'value'
+            roll_data: TurnRoll, or dict with 'roll_type' and 'value' (JSON publishers)
         """
         player = self._get_player(player_id)
 
-        # Parse roll type
-        roll_type_str = roll_data.get("roll_type", "")
-        try:
-            roll_type = RollType(roll_type_str)
-        except ValueError:
-            logger.warning(f"Invalid roll type: {roll_type_str}")
-            roll_type = RollType.POWER  # Default
+        if isinstance(roll_data, TurnRoll):
+            roll_type = roll_data.roll_type
+            value = roll_data.value
+        else:
+            # Parse roll type
+            roll_type_str = roll_data.get("roll_type", "")
+            if roll_type_str not in ROLL_TYPE_BY_VALUE:
+                logger.warning(f"Invalid roll type: {roll_type_str}")
+            roll_type = ROLL_TYPE_BY_VALUE.get(roll_type_str, RollType.POWER)  # Default
 
-        value = roll_data.get("value", 1)
+            value = roll_data.get("value", 1)
 
         player.last_turn_roll = TurnRoll(roll_type=roll_type, value=value)
 
@@ -201,11 +213,12 @@ class ProductionStateManager:
     def update_player_discard(self, player_id: int, uuids: list[str]) -> None:
         """Update player discard pile (Phase 2)."""
         player = self._get_player(player_id)
-        player.discard_pile = uuids
+        # Interned so repeated UUIDs across updates share one str (and match card keys)
+        player.discard_pile = tuple(sys.intern(uuid) for uuid in uuids)
 
         # Load card objects for discard pile
         cards = []
-        for uuid in uuids:
+        for uuid in player.discard_pile:
             try:
                 card = self.db.get_card_by_uuid(uuid)
                 if card:
@@ -220,11 +233,11 @@ class ProductionStateManager:
     def update_player_in_play(self, player_id: int, uuids: list[str]) -> None:
         """Update player in-play cards (Phase 2)."""
         player = self._get_player(player_id)
-        player.in_play = uuids
+        player.in_play = tuple(sys.intern(uuid) for uuid in uuids)
 
         # Load card objects for in-play cards
         cards = []
-        for uuid in uuids:
+        for uuid in player.in_play:
             try:
                 card = self.db.get_card_by_uuid(uuid)
                 if card:
@@ -8,6 +8,7 @@ import logging
 from collections.abc import Callable
 from typing import Any
 
+from ..shared.models import TurnRoll
 from ..shared.mqtt_client import MQTTClient, Topics
 
 logger = logging.getLogger(__name__)
@@ -26,6 +27,26 @@ class ProductionSubscriber:
         self.mqtt = mqtt_client
         self.callbacks: dict[str, Callable] = {}
 
+        # Handlers by match topic, and by field for supershow/player/{id}/{field} topics
+        self._match_handlers: dict[str, Callable[[Any], None]] = {
+            Topics.MATCH_INIT: self._handle_match_init,
+            Topics.MATCH_RESET: lambda _payload: self._handle_match_reset(),
+            Topics.MATCH_TITLE: self._handle_match_title,
+            Topics.MATCH_STIPULATIONS: self._handle_match_stipulations,
+            Topics.MATCH_CROWD_METER: self._handle_crowd_meter,
+        }
+        self._player_handlers: dict[str, Callable[[int, Any], None]] = {
+            "competitor": self._handle_player_competitor,
+            "hand_count": self._handle_player_hand_count,
+            "deck_count": self._handle_player_deck_count,
+            "turn_roll": self._handle_player_turn_roll,
+            "turns_passed": self._handle_player_turns_passed,
+            "finish_roll": self._handle_player_finish_roll,
+            "breakout_rolls": self._handle_player_breakout_rolls,
+            "discard": self._handle_player_discard,
+            "in_play": self._handle_player_in_play,
+        }
+
     def set_callback(self, callback_name: str, callback: Callable) -> None:
         """
         Set a callback function for a specific event type.
@@ -38,6 +59,11 @@ class ProductionSubscriber:
 
     def subscribe_all(self) -> None:
         """Subscribe to all supershow topics and setup message handler."""
+        # Turn rolls are sent as compact TurnRoll arrays; decode them into the model.
+        # Registered before subscribing so retained turn rolls delivered straight
+        # after the subscription are already decoded
+        self.mqtt.set_payload_type(Topics.PLAYER_TURN_ROLL.format(player_id="+"), TurnRoll)
+
         # Subscribe to all supershow topics
         self.mqtt.subscribe("supershow/#", qos=1)
         logger.info("Subscribed to supershow/#")
@@ -53,46 +79,22 @@ class ProductionSubscriber:
             topic: MQTT topic
             payload: Message payload (already decoded by MQTTClient)
         """
-        logger.debug(f"Received message on {topic}: {payload}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received message on %s: %s", topic, payload)
 
         try:
             # Match topics
-            if topic == Topics.MATCH_INIT:
-                self._handle_match_init(payload)
-            elif topic == Topics.MATCH_RESET:
-                self._handle_match_reset()
-            elif topic == Topics.MATCH_TITLE:
-                self._handle_match_title(payload)
-            elif topic == Topics.MATCH_STIPULATIONS:
-                self._handle_match_stipulations(payload)
-            elif topic == Topics.MATCH_CROWD_METER:
-                self._handle_crowd_meter(payload)
-
-            # Player topics - parse player_id from topic
+            handler = self._match_handlers.get(topic)
+            if handler is not None:
+                handler(payload)
+
+            # Player topics - parse player_id and field from topic
             elif topic.startswith("supershow/player/"):
-                parts = topic.split("/")
-                if len(parts) >= 4:
-                    player_id = int(parts[2])
-                    field = "/".join(parts[3:])
-
-                    if field == "competitor":
-                        self._handle_player_competitor(player_id, payload)
-                    elif field == "hand_count":
-                        self._handle_player_hand_count(player_id, payload)
-                    elif field == "deck_count":
-                        self._handle_player_deck_count(player_id, payload)
-                    elif field == "turn_roll":
-                        self._handle_player_turn_roll(player_id, payload)
-                    elif field == "turns_passed":
-                        self._handle_player_turns_passed(player_id, payload)
-                    elif field == "finish_roll":
-                        self._handle_player_finish_roll(player_id, payload)
-                    elif field == "breakout_rolls":
-                        self._handle_player_breakout_rolls(player_id, payload)
-                    elif field == "discard":
-                        self._handle_player_discard(player_id, payload)
-                    elif field == "in_play":
-                        self._handle_player_in_play(player_id, payload)
+                parts = topic.split("/", 3)
+                if len(parts) == 4:
+                    player_handler = self._player_handlers.get(parts[3])
+                    if player_handler is not None:
+                        player_handler(int(parts[2]), payload)
 
         except Exception as e:
             logger.error(f"Error handling message on {topic}: {e}", exc_info=True)
@@ -149,7 +151,7 @@ class ProductionSubscriber:
         if callback:
             callback(player_id, count)
 
-    def _handle_player_turn_roll(self, player_id: int, roll_data: dict) -> None:
+    def _handle_player_turn_roll(self, player_id: int, roll_data: TurnRoll | dict) -> None:
         """Handle player turn roll update."""
         callback = self.callbacks.get("player_turn_roll")
         if callback:
@@ -22,6 +22,7 @@ class MQTTConfig:
     keepalive: int = 60
     reconnect_delay_min: int = 1
     reconnect_delay_max: int = 60
+    use_msgpack: bool = True
 
 
 @dataclass
@@ -142,6 +143,7 @@ class Config:
             keepalive=mqtt.get("keepalive", 60),
             reconnect_delay_min=mqtt.get("reconnect_delay_min", 1),
             reconnect_delay_max=mqtt.get("reconnect_delay_max", 60),
+            use_msgpack=mqtt.get("use_msgpack", True),
         )
 
     @property
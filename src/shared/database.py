@@ -4,17 +4,197 @@ Handles SQLite connection and card queries
 """
 
 import logging
+import os
 import sqlite3
-from contextlib import contextmanager
+import sys
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import closing, contextmanager
+from functools import lru_cache
 from pathlib import Path
 
-from .models import AttackType, Card, CardType, PlayOrder
+from .models import (
+    ATTACK_TYPE_BY_VALUE,
+    CARD_TYPE_BY_VALUE,
+    PLAY_ORDER_BY_VALUE,
+    Card,
+    CardType,
+    ImageInfo,
+    ImageManifest,
+)
 
 logger = logging.getLogger(__name__)
 
+# Card types that represent competitors, used for index-friendly IN (...) filters
+COMPETITOR_TYPES = tuple(m.value for m in CardType if "Competitor" in m.value)
+_COMPETITOR_PLACEHOLDERS = ", ".join("?" * len(COMPETITOR_TYPES))
+
+# Card columns in Card field order; queries name them explicitly so rows can be
+# decoded positionally regardless of the physical column order of the table
+CARD_COLUMNS = (
+    "db_uuid",
+    "name",
+    "card_type",
+    "rules_text",
+    "errata_text",
+    "is_banned",
+    "release_set",
+    "srg_url",
+    "srgpc_url",
+    "comments",
+    "tags",
+    "power",
+    "agility",
+    "strike",
+    "submission",
+    "grapple",
+    "technique",
+    "division",
+    "gender",
+    "deck_card_number",
+    "atk_type",
+    "play_order",
+)
+_CARD_SELECT = f"SELECT {', '.join(CARD_COLUMNS)} FROM cards"
+_CARD_COLUMNS_QUALIFIED = ", ".join("c." + col for col in CARD_COLUMNS)
+_CARD_SELECT_FTS = (
+    f"SELECT {_CARD_COLUMNS_QUALIFIED} FROM cards c JOIN cards_fts f ON f.rowid = c.rowid"
+)
+
+# Fixed query text for the hot lookups; identical strings hit the connection's
+# prepared statement cache instead of being re-parsed on every call
+_SQL_BY_UUID = f"{_CARD_SELECT} WHERE db_uuid = ?"
+_SQL_BY_NAME = f"{_CARD_SELECT} WHERE name = ?"
+_SQL_BY_NAME_MATCH = f"{_CARD_SELECT_FTS} WHERE cards_fts MATCH ? ORDER BY rank LIMIT 1"
+_SQL_BY_NAME_LIKE = f"{_CARD_SELECT} WHERE name LIKE ? COLLATE NOCASE"
+_SQL_COMPETITORS = (
+    f"{_CARD_SELECT} WHERE card_type IN ({_COMPETITOR_PLACEHOLDERS}) ORDER BY name LIMIT ?"
+)
+_SQL_COMPETITORS_BY_DIVISION = (
+    f"{_CARD_SELECT} WHERE card_type IN ({_COMPETITOR_PLACEHOLDERS}) "
+    "AND division = ? ORDER BY name LIMIT ?"
+)
+_SQL_MAIN_DECK = f"{_CARD_SELECT} WHERE card_type = 'MainDeckCard' ORDER BY deck_card_number"
+_SQL_RELATED_FINISHES = "SELECT finish_uuid FROM card_related_finishes WHERE card_uuid = ?"
+_SQL_BY_TAG = (
+    f"SELECT {_CARD_COLUMNS_QUALIFIED} FROM cards c "
+    "JOIN card_tags t ON t.card_uuid = c.db_uuid WHERE t.tag = ? ORDER BY c.name LIMIT ?"
+)
+
+# Secondary indexes on cards, by name; dropped and rebuilt around bulk syncs
+CARD_INDEXES = {
+    "idx_cards_name": "CREATE INDEX IF NOT EXISTS idx_cards_name ON cards(name)",
+    "idx_cards_type": "CREATE INDEX IF NOT EXISTS idx_cards_type ON cards(card_type)",
+    "idx_cards_deck_number": (
+        "CREATE INDEX IF NOT EXISTS idx_cards_deck_number ON cards(deck_card_number)"
+    ),
+    # Serves get_competitors' type/division filter and name ordering without a sort
+    "idx_cards_type_div_name": (
+        "CREATE INDEX IF NOT EXISTS idx_cards_type_div_name ON cards(card_type, division, name)"
+    ),
+}
+
+# Local image manifest: one row per downloaded image with the server manifest
+# version it came from. Formatted with a schema prefix so the table can also
+# be created inside an attached database.
+_IMAGE_MANIFEST_TABLE = """
+    CREATE TABLE IF NOT EXISTS {schema}image_manifest (
+        uuid TEXT PRIMARY KEY,
+        hash TEXT NOT NULL,
+        path TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        generated TEXT NOT NULL
+    ) WITHOUT ROWID
+"""
+_IMAGE_MANIFEST_COLUMNS = "uuid, hash, path, version, generated"
+_SQL_UPSERT_IMAGE = (
+    f"INSERT OR REPLACE INTO image_manifest ({_IMAGE_MANIFEST_COLUMNS}) VALUES (?, ?, ?, ?, ?)"
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_tags(tags: str) -> tuple[str, ...]:
+    """Split a comma-separated tags string; many cards share the same string"""
+    return tuple(t.strip() for t in tags.split(","))
+
+
+def _card_row_factory(cursor: sqlite3.Cursor, row: tuple) -> Card:
+    """
+    Row factory that builds a Card from a row selected with CARD_COLUMNS
+
+    Args:
+        cursor: Cursor that produced the row
+        row: Row values in CARD_COLUMNS order
+
+    Returns:
+        Card object
+    """
+    (
+        db_uuid,
+        name,
+        card_type,
+        rules_text,
+        errata_text,
+        is_banned,
+        release_set,
+        srg_url,
+        srgpc_url,
+        comments,
+        tags,
+        power,
+        agility,
+        strike,
+        submission,
+        grapple,
+        technique,
+        division,
+        gender,
+        deck_card_number,
+        atk_type,
+        play_order,
+    ) = row
+
+    return Card(
+        # Interned so UUIDs received over MQTT/manifests share the same str objects
+        sys.intern(db_uuid),
+        name,
+        # Unknown card types stay str
+        CARD_TYPE_BY_VALUE.get(card_type, card_type) if card_type else None,
+        rules_text,
+        errata_text,
+        bool(is_banned),
+        release_set,
+        srg_url,
+        srgpc_url,
+        comments,
+        _parse_tags(tags) if tags else (),
+        power,
+        agility,
+        strike,
+        submission,
+        grapple,
+        technique,
+        division,
+        gender,
+        deck_card_number,
+        ATTACK_TYPE_BY_VALUE.get(atk_type) if atk_type else None,
+        PLAY_ORDER_BY_VALUE.get(play_order) if play_order else None,
+    )
+
 
 class DatabaseService:
-    """SQLite database service for card data"""
+    """
+    SQLite database service for card data
+
+    Writes (syncs and clears) go through a single writer connection guarded by
+    a lock. Reads use one query-only connection per thread, so render, sync and
+    MQTT threads can read concurrently under WAL.
+
+    Create one instance per process and keep it open, preferably as a context
+    manager (``with DatabaseService(path) as db:``). Connecting initializes the
+    schema and decodes every card into memory, so reopening per operation
+    repeats that work.
+    """
 
     def __init__(self, db_path: str):
         """
@@ -25,45 +205,161 @@ class DatabaseService:
         """
         self.db_path = Path(db_path)
         self._ensure_directory()
-        self._connection: sqlite3.Connection | None = None
+        self._connection: sqlite3.Connection | None = None  # Writer
+        self._fts_enabled = False
+
+        # Per-thread reader connections, owned by and only ever closed from their
+        # thread. The generation is bumped on disconnect so each thread closes
+        # and reopens its own connection on its next read; a connection held by
+        # a thread that exits is released along with the thread-local storage.
+        self._tls = threading.local()
+        self._generation = 0
+        self._write_lock = threading.RLock()
+
+        # Every card decoded into memory, rebuilt whenever the card data changes;
+        # None until the first connect
+        self._by_uuid: dict[str, Card] | None = None
+        self._by_name: dict[str, Card] | None = None
+
+        # Related finish lookups are cached until the card data changes
+        self._finishes_cache = lru_cache(maxsize=256)(self._get_related_finishes_bulk_uncached)
 
     def _ensure_directory(self) -> None:
         """Ensure database directory exists"""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    def connect(self) -> None:
-        """Open database connection"""
-        if self._connection is None:
-            self._connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
-            self._connection.row_factory = sqlite3.Row
-            logger.info(f"Connected to database: {self.db_path}")
-            self._init_tables()
+    def connect(self) -> sqlite3.Connection:
+        """
+        Open database connection
+
+        Returns:
+            The writer connection, already open if connect() was called before
+        """
+        with self._write_lock:
+            connection = self._connection
+            if connection is None:
+                connection = self._connection = self._open_connection()
+                self._enable_wal(connection)
+                logger.info(f"Connected to database: {self.db_path}")
+                self._init_tables()
+                self._warm_cache()
+            return connection
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open and tune a new connection to the database file"""
+        connection = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, cached_statements=256
+        )
+        self._apply_pragmas(connection)
+        return connection
+
+    @staticmethod
+    def _enable_wal(connection: sqlite3.Connection) -> None:
+        """Switch the database to WAL so readers proceed while a sync is writing"""
+        # WAL needs a writable directory for the -wal/-shm files, so fall back
+        # to the default journal where that is not possible
+        try:
+            mode = connection.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            if mode.lower() != "wal":
+                logger.warning(f"WAL journal mode unavailable, using {mode}")
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Could not enable WAL journal mode: {e}")
+
+    @staticmethod
+    def _apply_pragmas(connection: sqlite3.Connection) -> None:
+        """Tune a connection for a read-heavy workload with occasional bulk syncs"""
+        cursor = connection.cursor()
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        cursor.execute("PRAGMA foreign_keys=OFF")
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Writer connection, connecting on first use"""
+        connection = self._connection
+        return connection if connection is not None else self._lazy_connect()
+
+    def _lazy_connect(self) -> sqlite3.Connection:
+        """Slow path of conn: open the connection"""
+        return self.connect()
+
+    def _reader(self) -> sqlite3.Connection:
+        """Query-only connection for the calling thread, opened on first use"""
+        tls = self._tls
+        if getattr(tls, "generation", None) == self._generation:
+            reader: sqlite3.Connection = tls.connection
+            return reader
+
+        self._close_reader()
+
+        # Opened under the write lock so a new connection can't appear halfway
+        # through a file swap in replace_from_temp_db
+        with self._write_lock:
+            # Make sure the writer has created the schema before reading
+            if self._connection is None:
+                self.connect()
+
+            connection = self._open_connection()
+            connection.execute("PRAGMA query_only=1")
+            tls.connection = connection
+            tls.generation = self._generation
+
+        return connection
+
+    def _close_reader(self) -> None:
+        """Close the calling thread's reader connection, if it has one"""
+        tls = self._tls
+        connection = getattr(tls, "connection", None)
+        if connection is not None:
+            tls.connection = None
+            tls.generation = None
+            connection.close()
 
     def disconnect(self) -> None:
-        """Close database connection"""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
-            logger.info("Disconnected from database")
+        """Close database connections"""
+        with self._write_lock:
+            self._generation += 1
+            self._by_uuid = None
+            self._by_name = None
+            self._finishes_cache.cache_clear()
+            self._close_reader()
+
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+                logger.info("Disconnected from database")
 
     @contextmanager
     def transaction(self):
-        """Context manager for database transactions"""
-        if not self._connection:
-            self.connect()
+        """Context manager for database transactions on the writer connection"""
+        with self._write_lock:
+            conn = self.conn
 
-        try:
-            yield self._connection
-            self._connection.commit()
-        except Exception as e:
-            self._connection.rollback()
-            logger.error(f"Transaction failed, rolling back: {e}")
-            raise
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Transaction failed, rolling back: {e}")
+                raise
 
     def _init_tables(self) -> None:
         """Create tables if they don't exist"""
         cursor = self._connection.cursor()
+        self._create_tables(cursor)
+        self._connection.commit()
+        logger.info("Database tables initialized")
 
+    def _create_tables(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Create tables, indexes and the FTS index if they don't exist, without
+        committing, so callers can run it inside their own transaction
+
+        Args:
+            cursor: Writer cursor to execute on
+        """
         # Cards table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS cards (
@@ -111,33 +407,137 @@ class DatabaseService:
             )
         """)
 
+        # Card tags table (normalized from cards.tags for indexed tag queries)
+        tags_exist = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'card_tags'"
+        ).fetchone()
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS card_tags (
+                card_uuid TEXT NOT NULL,
+                tag TEXT NOT NULL,
+                PRIMARY KEY (card_uuid, tag)
+            )
+        """)
+
+        if not tags_exist:
+            self._populate_card_tags(cursor, "cards")
+
+        # Metadata table (stored counts etc.)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER
+            )
+        """)
+
+        # Local image manifest (kept across card data replacements)
+        cursor.execute(_IMAGE_MANIFEST_TABLE.format(schema=""))
+
         # Create indexes for common queries
+        for sql in CARD_INDEXES.values():
+            cursor.execute(sql)
+
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_cards_name
-            ON cards(name)
+            CREATE INDEX IF NOT EXISTS idx_card_tags_tag
+            ON card_tags(tag)
         """)
 
+        self._init_fts(cursor)
+
+    @staticmethod
+    def _populate_card_tags(cursor: sqlite3.Cursor, source: str) -> None:
+        """
+        Fill card_tags from the comma-separated tags column of a cards table
+
+        Args:
+            cursor: Cursor to execute on
+            source: Cards table to read from (e.g. "cards" or "temp_db.cards")
+        """
+        rows = cursor.execute(
+            f"SELECT db_uuid, tags FROM {source} WHERE tags IS NOT NULL AND tags != ''"
+        ).fetchall()
+
+        cursor.executemany(
+            "INSERT OR IGNORE INTO card_tags (card_uuid, tag) VALUES (?, ?)",
+            ((db_uuid, tag) for db_uuid, tags in rows for tag in _parse_tags(tags) if tag),
+        )
+
+    def _init_fts(self, cursor: sqlite3.Cursor) -> None:
+        """Create the full-text index over cards and the triggers that keep it in sync"""
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'cards_fts'"
+        ).fetchone()
+
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS cards_fts USING fts5(
+                    name, rules_text, tags,
+                    content='cards', content_rowid='rowid',
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, falling back to LIKE search: {e}")
+            self._fts_enabled = False
+            return
+
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_cards_type
-            ON cards(card_type)
+            CREATE TRIGGER IF NOT EXISTS cards_fts_ai AFTER INSERT ON cards BEGIN
+                INSERT INTO cards_fts(rowid, name, rules_text, tags)
+                VALUES (new.rowid, new.name, new.rules_text, new.tags);
+            END
         """)
 
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_cards_deck_number
-            ON cards(deck_card_number)
+            CREATE TRIGGER IF NOT EXISTS cards_fts_ad AFTER DELETE ON cards BEGIN
+                INSERT INTO cards_fts(cards_fts, rowid, name, rules_text, tags)
+                VALUES ('delete', old.rowid, old.name, old.rules_text, old.tags);
+            END
         """)
 
-        self._connection.commit()
-        logger.info("Database tables initialized")
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS cards_fts_au AFTER UPDATE ON cards BEGIN
+                INSERT INTO cards_fts(cards_fts, rowid, name, rules_text, tags)
+                VALUES ('delete', old.rowid, old.name, old.rules_text, old.tags);
+                INSERT INTO cards_fts(rowid, name, rules_text, tags)
+                VALUES (new.rowid, new.name, new.rules_text, new.tags);
+            END
+        """)
+
+        # Index any cards that were loaded before the FTS table existed
+        if not exists:
+            cursor.execute("INSERT INTO cards_fts(cards_fts) VALUES ('rebuild')")
+
+        self._fts_enabled = True
+
+    @staticmethod
+    def _fts_name_query(text: str) -> str | None:
+        """
+        Build an FTS5 MATCH expression for a prefix search on card names
+
+        Args:
+            text: User-entered search text
+
+        Returns:
+            MATCH expression, or None if the text has no searchable terms
+        """
+        terms = [t.replace('"', '""') for t in text.split()]
+        if not terms:
+            return None
+        return " ".join(f'name:"{t}"*' for t in terms)
 
     def get_card_count(self) -> int:
         """Get total number of cards in database"""
-        if not self._connection:
-            self.connect()
+        cursor = self._reader().cursor()
 
-        cursor = self._connection.cursor()
-        cursor.execute("SELECT COUNT(*) FROM cards")
-        return cursor.fetchone()[0]
+        # Stored at sync time, since COUNT(*) has to walk the whole table
+        row = cursor.execute("SELECT value FROM meta WHERE key = 'cards_count'").fetchone()
+        if row is None:
+            row = cursor.execute("SELECT COUNT(*) FROM cards").fetchone()
+
+        count: int = row[0]
+        return count
 
     def get_card_by_uuid(self, uuid: str) -> Card | None:
         """
@@ -149,16 +549,34 @@ class DatabaseService:
         Returns:
             Card object or None if not found
         """
-        if not self._connection:
-            self.connect()
+        by_uuid = self._by_uuid
+        if by_uuid is not None:
+            return by_uuid.get(uuid)
+
+        cursor = self._card_cursor()
+        cursor.execute(_SQL_BY_UUID, (uuid,))
+        card: Card | None = cursor.fetchone()
+        return card
 
+    def _warm_cache(self) -> None:
+        """Decode every card into the in-memory UUID and name maps"""
         cursor = self._connection.cursor()
-        cursor.execute("SELECT * FROM cards WHERE db_uuid = ?", (uuid,))
-        row = cursor.fetchone()
+        cursor.row_factory = _card_row_factory
+        cursor.execute(_CARD_SELECT)
+
+        by_uuid = {card.db_uuid: card for card in cursor.fetchall()}
+        by_name: dict[str, Card] = {}
+        for card in by_uuid.values():
+            by_name.setdefault(card.name, card)
+
+        self._by_uuid = by_uuid
+        self._by_name = by_name
+        logger.info(f"Cached {len(by_uuid)} cards in memory")
 
-        if row:
-            return self._row_to_card(row)
-        return None
+    def _refresh_card_caches(self) -> None:
+        """Rebuild cached card lookups after the card data changes"""
+        self._finishes_cache.cache_clear()
+        self._warm_cache()
 
     def get_card_by_name(self, name: str, exact: bool = True) -> Card | None:
         """
@@ -171,21 +589,25 @@ class DatabaseService:
         Returns:
             Card object or None if not found
         """
-        if not self._connection:
-            self.connect()
+        if exact:
+            by_name = self._by_name
+            if by_name is not None:
+                return by_name.get(name)
 
-        cursor = self._connection.cursor()
+        # Get the cursor first: it connects on first use, which is what sets
+        # _fts_enabled
+        cursor = self._card_cursor()
+        match = self._fts_name_query(name) if self._fts_enabled and not exact else None
 
         if exact:
-            cursor.execute("SELECT * FROM cards WHERE name = ?", (name,))
+            cursor.execute(_SQL_BY_NAME, (name,))
+        elif match:
+            cursor.execute(_SQL_BY_NAME_MATCH, (match,))
         else:
-            cursor.execute("SELECT * FROM cards WHERE name LIKE ? COLLATE NOCASE", (f"%{name}%",))
-
-        row = cursor.fetchone()
+            cursor.execute(_SQL_BY_NAME_LIKE, (f"%{name}%",))
 
-        if row:
-            return self._row_to_card(row)
-        return None
+        card: Card | None = cursor.fetchone()
+        return card
 
     def search_cards(
         self,
@@ -200,7 +622,7 @@ class DatabaseService:
         Search cards with filters
 
         Args:
-            query: Text search in card name
+            query: Prefix text search on card name words
             card_type: Filter by card type
             atk_type: Filter by attack type
             play_order: Filter by play order
@@ -210,13 +632,18 @@ class DatabaseService:
         Returns:
             List of matching cards
         """
-        if not self._connection:
-            self.connect()
+        # Get the cursor first: it connects on first use, which is what sets
+        # _fts_enabled
+        cursor = self._card_cursor()
 
         conditions = []
         params = []
+        match = self._fts_name_query(query) if query and self._fts_enabled else None
 
-        if query:
+        if match:
+            conditions.append("cards_fts MATCH ?")
+            params.append(match)
+        elif query:
             conditions.append("name LIKE ? COLLATE NOCASE")
             params.append(f"%{query}%")
 
@@ -237,13 +664,15 @@ class DatabaseService:
             params.append(division)
 
         where_clause = " AND ".join(conditions) if conditions else "1=1"
-        sql = f"SELECT * FROM cards WHERE {where_clause} ORDER BY name LIMIT ?"
+        if match:
+            sql = f"{_CARD_SELECT_FTS} WHERE {where_clause} ORDER BY rank LIMIT ?"
+        else:
+            sql = f"{_CARD_SELECT} WHERE {where_clause} ORDER BY name LIMIT ?"
         params.append(limit)
 
-        cursor = self._connection.cursor()
         cursor.execute(sql, params)
 
-        return [self._row_to_card(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
 
     def get_competitors(self, division: str | None = None, limit: int | None = None) -> list[Card]:
         """
@@ -256,26 +685,17 @@ class DatabaseService:
         Returns:
             List of competitor cards
         """
-        if not self._connection:
-            self.connect()
+        cursor = self._card_cursor()
 
-        cursor = self._connection.cursor()
+        # SQLite treats a negative LIMIT as unbounded
+        limit = limit if limit else -1
 
         if division:
-            sql = (
-                "SELECT * FROM cards WHERE card_type LIKE '%Competitor%' "
-                "AND division = ? ORDER BY name"
-            )
-            if limit:
-                sql += f" LIMIT {limit}"
-            cursor.execute(sql, (division,))
+            cursor.execute(_SQL_COMPETITORS_BY_DIVISION, (*COMPETITOR_TYPES, division, limit))
         else:
-            sql = "SELECT * FROM cards WHERE card_type LIKE '%Competitor%' ORDER BY name"
-            if limit:
-                sql += f" LIMIT {limit}"
-            cursor.execute(sql)
+            cursor.execute(_SQL_COMPETITORS, (*COMPETITOR_TYPES, limit))
 
-        return [self._row_to_card(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
 
     def get_main_deck_cards(self) -> list[Card]:
         """
@@ -284,15 +704,40 @@ class DatabaseService:
         Returns:
             List of main deck cards ordered by deck number
         """
-        if not self._connection:
-            self.connect()
+        cursor = self._card_cursor()
+        cursor.execute(_SQL_MAIN_DECK)
 
-        cursor = self._connection.cursor()
-        cursor.execute(
-            "SELECT * FROM cards WHERE card_type = 'MainDeckCard' ORDER BY deck_card_number"
-        )
+        return cursor.fetchall()
+
+    def iter_main_deck_cards(self) -> Iterator[Card]:
+        """
+        Stream main deck cards in batches without materializing the full list
+
+        Yields:
+            Main deck cards ordered by deck number
+        """
+        cursor = self._card_cursor()
+        cursor.arraysize = 512
+        cursor.execute(_SQL_MAIN_DECK)
+
+        while rows := cursor.fetchmany():
+            yield from rows
+
+    def get_cards_by_tag(self, tag: str, limit: int = 100) -> list[Card]:
+        """
+        Get cards carrying a tag
+
+        Args:
+            tag: Exact tag name
+            limit: Maximum results to return
+
+        Returns:
+            List of matching cards ordered by name
+        """
+        cursor = self._card_cursor()
+        cursor.execute(_SQL_BY_TAG, (tag, limit))
 
-        return [self._row_to_card(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
 
     def get_related_finishes(self, card_uuid: str) -> list[str]:
         """
@@ -304,161 +749,359 @@ class DatabaseService:
         Returns:
             List of finish card UUIDs
         """
-        if not self._connection:
-            self.connect()
+        cursor = self._reader().cursor()
+        cursor.execute(_SQL_RELATED_FINISHES, (card_uuid,))
 
-        cursor = self._connection.cursor()
+        return [row[0] for row in cursor.fetchall()]
+
+    def get_related_finishes_bulk(self, card_uuids: Sequence[str]) -> dict[str, list[str]]:
+        """
+        Get related finish UUIDs for several cards in one query
+
+        Args:
+            card_uuids: Card UUIDs
+
+        Returns:
+            Dict of {card_uuid: [finish_uuid, ...]}, with an empty list for
+            cards that have no related finishes
+        """
+        grouped = self._finishes_cache(frozenset(card_uuids))
+        return {uuid: list(finishes) for uuid, finishes in grouped.items()}
+
+    def _get_related_finishes_bulk_uncached(
+        self, card_uuids: frozenset[str]
+    ) -> dict[str, tuple[str, ...]]:
+        """Query related finishes for a set of cards, bypassing the cache"""
+        grouped: dict[str, list[str]] = {uuid: [] for uuid in card_uuids}
+        if not grouped:
+            return {}
+
+        placeholders = ", ".join("?" * len(grouped))
+        cursor = self._reader().cursor()
         cursor.execute(
-            "SELECT finish_uuid FROM card_related_finishes WHERE card_uuid = ?", (card_uuid,)
+            "SELECT card_uuid, finish_uuid FROM card_related_finishes "
+            f"WHERE card_uuid IN ({placeholders})",
+            tuple(grouped),
         )
 
-        return [row[0] for row in cursor.fetchall()]
+        for card_uuid, finish_uuid in cursor.fetchall():
+            grouped[card_uuid].append(finish_uuid)
 
-    def clear_card_data(self) -> None:
-        """Clear all card data (for sync replacement)"""
-        if not self._connection:
-            self.connect()
+        return {uuid: tuple(finishes) for uuid, finishes in grouped.items()}
+
+    def get_image_manifest(self) -> ImageManifest | None:
+        """
+        Get the local image manifest
+
+        Returns:
+            ImageManifest of downloaded images, or None if none are recorded
+        """
+        cursor = self._reader().cursor()
+
+        images = {}
+        version = 0
+        generated = ""
+        for uuid, image_hash, path, row_version, row_generated in cursor.execute(
+            f"SELECT {_IMAGE_MANIFEST_COLUMNS} FROM image_manifest"
+        ):
+            images[sys.intern(uuid)] = ImageInfo(hash=image_hash, path=path)
+            if row_version >= version:
+                version = row_version
+                generated = row_generated
+
+        if not images:
+            return None
+
+        return ImageManifest(
+            version=version, generated=generated, image_count=len(images), images=images
+        )
+
+    def get_image_hashes(self) -> dict[str, str]:
+        """
+        Get the hashes of downloaded images
 
+        Returns:
+            Dict of {uuid: hash}
+        """
+        cursor = self._reader().cursor()
+        return dict(cursor.execute("SELECT uuid, hash FROM image_manifest"))
+
+    def save_image_manifest(self, manifest: ImageManifest) -> None:
+        """
+        Replace the local image manifest
+
+        Args:
+            manifest: ImageManifest of downloaded images
+        """
         with self.transaction() as conn:
             cursor = conn.cursor()
-            cursor.execute("DELETE FROM card_related_finishes")
-            cursor.execute("DELETE FROM card_related_cards")
-            cursor.execute("DELETE FROM cards")
-            logger.info("Cleared all card data")
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("DELETE FROM image_manifest")
+            self._upsert_images(cursor, manifest.images, manifest.version, manifest.generated)
+
+    def upsert_images(self, images: dict[str, ImageInfo], version: int, generated: str) -> None:
+        """
+        Record downloaded images in the local image manifest
+
+        Args:
+            images: Dict of {uuid: ImageInfo} for the downloaded images
+            version: Server manifest version the images came from
+            generated: Server manifest generation timestamp
+        """
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            self._upsert_images(cursor, images, version, generated)
+
+    @staticmethod
+    def _upsert_images(
+        cursor: sqlite3.Cursor, images: dict[str, ImageInfo], version: int, generated: str
+    ) -> None:
+        """Insert or replace image manifest rows in one executemany"""
+        cursor.executemany(
+            _SQL_UPSERT_IMAGE,
+            ((uuid, info.hash, info.path, version, generated) for uuid, info in images.items()),
+        )
+
+    def clear_card_data(self) -> None:
+        """Clear all card data (for sync replacement)"""
+        # Hold the lock across the refresh too, so readers never see cached
+        # cards that were just dropped and the warm-up reads aren't interleaved
+        # with other writes on the shared connection
+        with self._write_lock:
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+
+                # Dropping and recreating the tables frees their pages in one step
+                # instead of deleting (and FTS-unindexing) every row
+                cursor.execute("DROP TABLE IF EXISTS card_related_finishes")
+                cursor.execute("DROP TABLE IF EXISTS card_related_cards")
+                cursor.execute("DROP TABLE IF EXISTS card_tags")
+                cursor.execute("DROP TABLE IF EXISTS cards_fts")
+                cursor.execute("DROP TABLE IF EXISTS cards")
+                cursor.execute("INSERT OR REPLACE INTO meta VALUES ('cards_count', 0)")
+                self._create_tables(cursor)
+                logger.info("Cleared all card data")
+
+            self._refresh_card_caches()
 
     def replace_from_temp_db(self, temp_db_path: str) -> tuple[int, int, int]:
         """
         Replace card data from temporary database
 
+        The temporary database file is moved into place when possible, which
+        consumes it; otherwise its rows are copied into the live database.
+
         Args:
             temp_db_path: Path to temporary database file
 
         Returns:
             Tuple of (cards_count, finishes_count, related_cards_count)
         """
-        if not self._connection:
-            self.connect()
+        with self._write_lock:
+            if self._is_swap_compatible(temp_db_path) and self._carry_over_image_manifest(
+                temp_db_path
+            ):
+                self.disconnect()
+
+                # Leftover -wal/-shm files mean another process, or another
+                # thread's reader connection, still has the database open;
+                # swapping the file under it is unsafe
+                if self._has_open_journal():
+                    logger.info("Database is open elsewhere, copying rows instead")
+                else:
+                    try:
+                        os.replace(temp_db_path, self.db_path)
+                    except OSError as e:
+                        logger.warning(f"Database file swap failed, copying rows instead: {e}")
+                    else:
+                        return self._finish_swap()
+
+            return self._replace_via_attach(temp_db_path)
+
+    @staticmethod
+    def _is_swap_compatible(temp_db_path: str) -> bool:
+        """Check that a temporary database has the tables and columns we query"""
+        try:
+            uri = f"{Path(temp_db_path).resolve().as_uri()}?mode=ro"
+            with closing(sqlite3.connect(uri, uri=True)) as temp:
+                tables = {
+                    row[0]
+                    for row in temp.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+                }
+                if not {"cards", "card_related_finishes", "card_related_cards"} <= tables:
+                    return False
+
+                columns = {row[1] for row in temp.execute("PRAGMA table_info(cards)")}
+                return set(CARD_COLUMNS) <= columns
+
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Temporary database is not swappable: {e}")
+            return False
+
+    def _carry_over_image_manifest(self, temp_db_path: str) -> bool:
+        """
+        Copy the local image manifest into a temporary database before it is
+        swapped in, so the swap doesn't forget which images are downloaded
 
-        cursor = self._connection.cursor()
+        Args:
+            temp_db_path: Path to temporary database file
 
-        # First, attach temp database (outside transaction)
-        logger.info(f"Attaching temporary database: {temp_db_path}")
-        cursor.execute(f"ATTACH DATABASE '{temp_db_path}' AS temp_db")
+        Returns:
+            True if the manifest was copied and the swap can go ahead
+        """
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("ATTACH DATABASE ? AS temp_db", (str(temp_db_path),))
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Could not attach temporary database: {e}")
+            return False
 
         try:
-            # Use with statement for transaction
             with self.transaction():
-                # Clear existing data
-                logger.info("Clearing existing card data...")
-                cursor.execute("DELETE FROM card_related_finishes")
-                cursor.execute("DELETE FROM card_related_cards")
-                cursor.execute("DELETE FROM cards")
-
-                # Copy cards
-                logger.info("Copying cards...")
-                cursor.execute("INSERT INTO cards SELECT * FROM temp_db.cards")
-
-                # Copy related finishes
-                logger.info("Copying related finishes...")
+                cursor.execute(_IMAGE_MANIFEST_TABLE.format(schema="temp_db."))
                 cursor.execute(
-                    "INSERT INTO card_related_finishes SELECT * FROM temp_db.card_related_finishes"
+                    f"INSERT OR REPLACE INTO temp_db.image_manifest ({_IMAGE_MANIFEST_COLUMNS}) "
+                    f"SELECT {_IMAGE_MANIFEST_COLUMNS} FROM main.image_manifest"
                 )
+            return True
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Could not carry image manifest over, copying rows instead: {e}")
+            return False
+        finally:
+            cursor.execute("DETACH DATABASE temp_db")
 
-                # Copy related cards
-                logger.info("Copying related cards...")
-                cursor.execute(
-                    "INSERT INTO card_related_cards SELECT * FROM temp_db.card_related_cards"
-                )
+    def _has_open_journal(self) -> bool:
+        """Whether WAL or rollback journal files exist beside the database"""
+        return any(
+            Path(f"{self.db_path}{suffix}").exists() for suffix in ("-wal", "-shm", "-journal")
+        )
 
-            # Transaction committed successfully, now detach
-            logger.info("Detaching temporary database...")
-            cursor.execute("DETACH DATABASE temp_db")
+    def _finish_swap(self) -> tuple[int, int, int]:
+        """Reopen the database after a file swap and record its counts"""
+        # Reconnecting creates the FTS index, tag table, meta table and indexes
+        self.connect()
 
-            # Get counts
+        with self.transaction() as conn:
+            cursor = conn.cursor()
             cards_count = cursor.execute("SELECT COUNT(*) FROM cards").fetchone()[0]
             finishes_count = cursor.execute(
                 "SELECT COUNT(*) FROM card_related_finishes"
             ).fetchone()[0]
             related_count = cursor.execute("SELECT COUNT(*) FROM card_related_cards").fetchone()[0]
+            cursor.execute("INSERT OR REPLACE INTO meta VALUES ('cards_count', ?)", (cards_count,))
 
-            logger.info(
-                f"Database sync complete: {cards_count} cards, "
-                f"{finishes_count} finishes, {related_count} related cards"
-            )
+        self.conn.execute("ANALYZE cards")
 
-            return (cards_count, finishes_count, related_count)
+        logger.info(
+            f"Database swapped in: {cards_count} cards, "
+            f"{finishes_count} finishes, {related_count} related cards"
+        )
 
-        except Exception as e:
-            # Rollback happened in transaction context manager
-            logger.error(f"Database replacement failed: {e}")
-            # Try to detach if still attached
-            try:
-                cursor.execute("DETACH DATABASE temp_db")
-            except:
-                pass
-            raise
+        return (cards_count, finishes_count, related_count)
 
-    def _row_to_card(self, row: sqlite3.Row) -> Card:
+    def _replace_via_attach(self, temp_db_path: str) -> tuple[int, int, int]:
         """
-        Convert database row to Card object
+        Replace card data by copying rows from an attached temporary database
 
         Args:
-            row: Database row
+            temp_db_path: Path to temporary database file
 
         Returns:
-            Card object
+            Tuple of (cards_count, finishes_count, related_cards_count)
         """
-        # Parse tags from comma-separated string
-        tags = []
-        if row["tags"]:
-            tags = [t.strip() for t in row["tags"].split(",")]
+        with self._write_lock:
+            cursor = self.conn.cursor()
 
-        # Parse enums
-        card_type = None
-        if row["card_type"]:
-            try:
-                card_type = CardType(row["card_type"])
-            except ValueError:
-                card_type = row["card_type"]  # Store as string if not in enum
+            # First, attach temp database (outside transaction)
+            logger.info(f"Attaching temporary database: {temp_db_path}")
+            cursor.execute("ATTACH DATABASE ? AS temp_db", (str(temp_db_path),))
 
-        atk_type = None
-        if row["atk_type"]:
-            try:
-                atk_type = AttackType(row["atk_type"])
-            except ValueError:
-                pass
+            # The copy is atomic, so the per-commit fsync buys nothing here
+            cursor.execute("PRAGMA synchronous=OFF")
 
-        play_order = None
-        if row["play_order"]:
             try:
-                play_order = PlayOrder(row["play_order"])
-            except ValueError:
-                pass
-
-        return Card(
-            db_uuid=row["db_uuid"],
-            name=row["name"],
-            card_type=card_type,
-            rules_text=row["rules_text"],
-            errata_text=row["errata_text"],
-            is_banned=bool(row["is_banned"]),
-            release_set=row["release_set"],
-            srg_url=row["srg_url"],
-            srgpc_url=row["srgpc_url"],
-            comments=row["comments"],
-            tags=tags,
-            power=row["power"],
-            agility=row["agility"],
-            strike=row["strike"],
-            submission=row["submission"],
-            grapple=row["grapple"],
-            technique=row["technique"],
-            division=row["division"],
-            gender=row["gender"],
-            deck_card_number=row["deck_card_number"],
-            atk_type=atk_type,
-            play_order=play_order,
-        )
+                # Use with statement for transaction
+                with self.transaction():
+                    cursor.execute("BEGIN IMMEDIATE")
+
+                    # Drop secondary indexes so they are built once from the full
+                    # data set instead of being maintained row by row during the copy
+                    for index_name in CARD_INDEXES:
+                        cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+                    # Clear existing data
+                    logger.info("Clearing existing card data...")
+                    cursor.execute("DELETE FROM card_related_finishes")
+                    cursor.execute("DELETE FROM card_related_cards")
+                    cursor.execute("DELETE FROM card_tags")
+                    cursor.execute("DELETE FROM cards")
+
+                    # Copy cards
+                    logger.info("Copying cards...")
+                    cursor.execute("INSERT INTO cards SELECT * FROM temp_db.cards")
+                    cards_count = cursor.rowcount
+
+                    # Normalize tags
+                    logger.info("Indexing card tags...")
+                    self._populate_card_tags(cursor, "temp_db.cards")
+
+                    # Copy related finishes
+                    logger.info("Copying related finishes...")
+                    cursor.execute(
+                        "INSERT INTO card_related_finishes SELECT * FROM temp_db.card_related_finishes"
+                    )
+                    finishes_count = cursor.rowcount
+
+                    # Copy related cards
+                    logger.info("Copying related cards...")
+                    cursor.execute(
+                        "INSERT INTO card_related_cards SELECT * FROM temp_db.card_related_cards"
+                    )
+                    related_count = cursor.rowcount
+
+                    cursor.execute(
+                        "INSERT OR REPLACE INTO meta VALUES ('cards_count', ?)", (cards_count,)
+                    )
+
+                    logger.info("Rebuilding indexes...")
+                    for sql in CARD_INDEXES.values():
+                        cursor.execute(sql)
+
+                self._refresh_card_caches()
+
+                # Transaction committed successfully, now detach
+                logger.info("Detaching temporary database...")
+                cursor.execute("DETACH DATABASE temp_db")
+
+                cursor.execute("ANALYZE cards")
+
+                logger.info(
+                    f"Database sync complete: {cards_count} cards, "
+                    f"{finishes_count} finishes, {related_count} related cards"
+                )
+
+                return (cards_count, finishes_count, related_count)
+
+            except Exception as e:
+                # Rollback happened in transaction context manager
+                logger.error(f"Database replacement failed: {e}")
+                # Try to detach if still attached
+                try:
+                    cursor.execute("DETACH DATABASE temp_db")
+                except:
+                    pass
+                raise
+
+            finally:
+                cursor.execute("PRAGMA synchronous=NORMAL")
+
+    def _card_cursor(self) -> sqlite3.Cursor:
+        """Create a cursor whose rows are decoded into Card objects"""
+        cursor = self._reader().cursor()
+        cursor.row_factory = _card_row_factory
+        return cursor
 
     def __enter__(self):
         """Context manager entry"""
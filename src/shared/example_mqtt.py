@@ -8,6 +8,7 @@ To start a local broker with Docker:
 """
 
 import logging
+import threading
 import time
 from typing import Any
 
@@ -48,9 +49,12 @@ def test_basic_pubsub():
     )
 
     # Set up connection callback
+    connected_evt = threading.Event()
+
     def on_connect(success: bool):
         if success:
             logger.info("✓ Connected successfully")
+            connected_evt.set()
         else:
             logger.error("✗ Connection failed")
 
@@ -58,10 +62,14 @@ def test_basic_pubsub():
 
     # Set up message callback
     messages_received = []
+    expected_messages = 2
+    all_received_evt = threading.Event()
 
     def on_message(topic: str, payload: Any):
         logger.info(f"Received on {topic}: {payload}")
         messages_received.append((topic, payload))
+        if len(messages_received) >= expected_messages:
+            all_received_evt.set()
 
     client.set_on_message_callback(on_message)
 
@@ -70,7 +78,7 @@ def test_basic_pubsub():
     client.connect()
 
     # Wait for connection
-    time.sleep(2)
+    connected_evt.wait(timeout=5)
 
     if not client.connected:
         logger.error("Failed to connect to broker. Is it running?")
@@ -87,7 +95,7 @@ def test_basic_pubsub():
     client.publish("supershow/test", {"type": "test", "value": 123}, qos=1)
 
     # Wait for messages
-    time.sleep(1)
+    all_received_evt.wait(timeout=5)
 
     # Check results
     logger.info(f"Received {len(messages_received)} messages")
@@ -128,12 +136,30 @@ def test_match_state_publishing():
         password=config.mqtt.password if config.mqtt.password else None,
     )
 
+    # Set up connection callbacks
+    controller_connected = threading.Event()
+    production_connected = threading.Event()
+
+    def connect_waiter(evt: threading.Event):
+        def on_connect(success: bool):
+            if success:
+                evt.set()
+
+        return on_connect
+
+    controller.set_on_connect_callback(connect_waiter(controller_connected))
+    production.set_on_connect_callback(connect_waiter(production_connected))
+
     # Set up production client to receive updates
     updates_received = []
+    expected_updates = 5  # match init, 3 player updates, turn roll event
+    all_received_evt = threading.Event()
 
     def on_state_update(topic: str, payload: Any):
         logger.info(f"Production received: {topic}")
         updates_received.append((topic, payload))
+        if len(updates_received) >= expected_updates:
+            all_received_evt.set()
 
     production.set_on_message_callback(on_state_update)
 
@@ -142,7 +168,8 @@ def test_match_state_publishing():
     controller.connect()
     production.connect()
 
-    time.sleep(2)
+    controller_connected.wait(timeout=5)
+    production_connected.wait(timeout=5)
 
     if not controller.connected or not production.connected:
         logger.error("Failed to connect clients")
@@ -156,6 +183,8 @@ def test_match_state_publishing():
     production.subscribe("supershow/player/#", qos=1)
     production.subscribe("supershow/events/#", qos=1)
 
+    # MQTTClient has no SUBACK callback, so give the subscriptions a moment
+    # to become active before the (non-retained) event is published
     time.sleep(1)
 
     # Controller publishes match initialization
@@ -183,7 +212,7 @@ def test_match_state_publishing():
     controller.publish(Topics.EVENT_TURN_ROLL, turn_roll, qos=1)
 
     # Wait for messages to be received
-    time.sleep(2)
+    all_received_evt.wait(timeout=5)
 
     # Check results
     logger.info(f"Production received {len(updates_received)} updates:")
@@ -1,10 +1,16 @@
 """
 Data models for BPP Supershow Overlay
+
+Models are msgspec Structs so they can be encoded/decoded directly by the MQTT
+client. Records that are never modified after loading (cards, rolls, events,
+manifest entries) are frozen; the small high-volume ones are created with
+gc=False since they never take part in reference cycles.
 """
 
-from dataclasses import dataclass, field
 from enum import Enum
 
+import msgspec
+
 
 # Enums
 class RollType(Enum):
@@ -39,17 +45,26 @@ class CardType(Enum):
     TORNADO_COMPETITOR_CARD = "TornadoCompetitorCard"
 
 
+# Enum lookups by value, so decoding a stored/received value is a dict hit rather
+# than an Enum call (which scans members and raises on unknown values)
+ROLL_TYPE_BY_VALUE = {m.value: m for m in RollType}
+ATTACK_TYPE_BY_VALUE = {m.value: m for m in AttackType}
+PLAY_ORDER_BY_VALUE = {m.value: m for m in PlayOrder}
+CARD_TYPE_BY_VALUE = {m.value: m for m in CardType}
+
+
 # Data Models
-@dataclass
-class TurnRoll:
+# TurnRoll and MatchEvent are the highest-volume messages, so they are encoded as
+# positional arrays instead of maps. The tag is written as the first element and
+# acts as the schema version; bump it when the field list changes.
+class TurnRoll(msgspec.Struct, frozen=True, gc=False, array_like=True, tag=1):
     """Turn roll information"""
 
     roll_type: RollType
     value: int  # 1-12
 
 
-@dataclass
-class Card:
+class Card(msgspec.Struct, frozen=True, gc=False):
     """Card from database"""
 
     db_uuid: str
@@ -62,7 +77,7 @@ class Card:
     srg_url: str | None = None
     srgpc_url: str | None = None
     comments: str | None = None
-    tags: list[str] = field(default_factory=list)
+    tags: tuple[str, ...] = ()
 
     # Competitor-specific fields
     power: int | None = None
@@ -80,24 +95,23 @@ class Card:
     play_order: PlayOrder | None = None
 
 
-@dataclass
-class PlayerState:
+class PlayerState(msgspec.Struct):
     """State for a single player"""
 
     player_id: int  # 1 or 2
     competitor_uuid: str | None = None
     hand_count: int = 0
     deck_count: int = 30
-    discard_pile: list[str] = field(default_factory=list)  # UUIDs
-    in_play: list[str] = field(default_factory=list)  # UUIDs
+    # Replaced wholesale on each update, so immutable tuples share the empty default
+    discard_pile: tuple[str, ...] = ()  # UUIDs
+    in_play: tuple[str, ...] = ()  # UUIDs
     last_turn_roll: TurnRoll | None = None
     turns_passed: int = 0
     finish_roll: int | None = None  # Finish roll value (1-12)
-    breakout_rolls: list[int] = field(default_factory=list)  # List of breakout roll values
+    breakout_rolls: list[int] = msgspec.field(default_factory=list)  # List of breakout roll values
 
 
-@dataclass
-class MatchState:
+class MatchState(msgspec.Struct):
     """Complete match state"""
 
     match_id: str
@@ -105,12 +119,11 @@ class MatchState:
     stipulations: str
     crowd_meter: int = 0
     started_at: int | None = None  # Unix timestamp
-    player1: PlayerState = field(default_factory=lambda: PlayerState(player_id=1))
-    player2: PlayerState = field(default_factory=lambda: PlayerState(player_id=2))
+    player1: PlayerState = msgspec.field(default_factory=lambda: PlayerState(player_id=1))
+    player2: PlayerState = msgspec.field(default_factory=lambda: PlayerState(player_id=2))
 
 
-@dataclass
-class MatchEvent:
+class MatchEvent(msgspec.Struct, frozen=True, array_like=True, tag=1):
     """Match event for recording"""
 
     event_id: str
@@ -118,11 +131,10 @@ class MatchEvent:
     timestamp: int  # Unix timestamp
     event_type: str
     player_id: int | None = None
-    data: dict = field(default_factory=dict)
+    data: dict = msgspec.field(default_factory=dict)
 
 
-@dataclass
-class CardsManifest:
+class CardsManifest(msgspec.Struct, frozen=True, gc=False):
     """Cards database manifest"""
 
     version: int
@@ -131,19 +143,17 @@ class CardsManifest:
     generated: str
 
 
-@dataclass
-class ImageInfo:
+class ImageInfo(msgspec.Struct, frozen=True, gc=False):
     """Image information in manifest"""
 
     hash: str  # SHA256
     path: str  # Relative path
 
 
-@dataclass
-class ImageManifest:
+class ImageManifest(msgspec.Struct, gc=False):
     """Images manifest"""
 
     version: int
     generated: str
     image_count: int
-    images: dict[str, ImageInfo] = field(default_factory=dict)  # uuid -> ImageInfo
+    images: dict[str, ImageInfo] = msgspec.field(default_factory=dict)  # uuid -> ImageInfo
@@ -3,16 +3,112 @@ MQTT client module for BPP Supershow Overlay
 Handles MQTT connection, publishing, and subscribing
 """
 
-import json
 import logging
-import time
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
+from enum import Enum
+from functools import cache, lru_cache
 from typing import Any
 
+import msgspec
+import orjson
 import paho.mqtt.client as mqtt
 
 logger = logging.getLogger(__name__)
 
+# MessagePack payloads are prefixed with 0xC1, a byte MessagePack never emits and
+# that cannot start valid UTF-8, so plain text and JSON payloads (older clients,
+# mosquitto_pub) are still recognized on receive.
+MSGPACK_PREFIX = b"\xc1"
+
+_OK = mqtt.MQTT_ERR_SUCCESS
+
+_ENCODER = msgspec.msgpack.Encoder()
+_DECODER = msgspec.msgpack.Decoder()
+
+
+def _encode(payload: Any, use_msgpack: bool) -> bytes:
+    """Encode a structured payload as prefixed MessagePack or JSON"""
+    if use_msgpack:
+        return MSGPACK_PREFIX + _ENCODER.encode(payload)
+    return orjson.dumps(payload, default=msgspec.to_builtins)
+
+
+_SCALAR_TYPES = frozenset((bool, int, str, bytes, type(None)))
+
+
+def _cache_key(payload: Any) -> Hashable | None:
+    """
+    Build an encode-cache key that tells apart values that compare equal but encode
+    differently (1 / True / 1.0, 0.0 / -0.0), including inside tuples and Structs
+
+    Returns:
+        Hashable key, or None if the payload shouldn't be cached
+    """
+    payload_type = type(payload)
+    if payload_type in _SCALAR_TYPES or isinstance(payload, Enum):
+        return (payload_type, payload)
+    if payload_type is float:
+        return (float, payload.hex())
+    if isinstance(payload, tuple):
+        items = tuple(_cache_key(item) for item in payload)
+        return None if None in items else (payload_type, items)
+    if isinstance(payload, msgspec.Struct) and payload.__struct_config__.frozen:
+        fields = _cache_key(tuple(getattr(payload, name) for name in payload.__struct_fields__))
+        return None if fields is None else (payload_type, fields)
+    return None
+
+
+@lru_cache(maxsize=256)
+def _encode_cached(key: Hashable, payload: Any, use_msgpack: bool) -> bytes:
+    """Encode a payload, reusing the bytes when a value with the same key is republished"""
+    return _encode(payload, use_msgpack)
+
+
+@cache
+def _typed_decoder(payload_type: type) -> msgspec.msgpack.Decoder:
+    """Return a shared MessagePack decoder that decodes straight into payload_type"""
+    return msgspec.msgpack.Decoder(payload_type)
+
+
+def _decode_payload(payload_bytes: bytes, payload_type: type | None) -> Any:
+    """
+    Decode a received payload: MessagePack if prefixed, otherwise JSON, otherwise text
+
+    Payloads that don't fit payload_type (e.g. from an older publisher) are returned
+    decoded but untyped rather than dropped.
+    """
+    try:
+        if payload_bytes[:1] == MSGPACK_PREFIX:
+            data = memoryview(payload_bytes)[1:]
+            if payload_type is not None:
+                try:
+                    return _typed_decoder(payload_type).decode(data)
+                except msgspec.ValidationError:
+                    pass
+            return _DECODER.decode(data)
+        payload = orjson.loads(payload_bytes)
+    except (msgspec.DecodeError, orjson.JSONDecodeError):
+        return payload_bytes.decode("utf-8", errors="replace")
+    return _convert_payload(payload, payload_type)
+
+
+def _convert_payload(payload: Any, payload_type: type | None) -> Any:
+    """Convert an untyped decoded payload to payload_type, leaving it as-is if it doesn't fit"""
+    if payload_type is not None:
+        try:
+            return msgspec.convert(payload, payload_type)
+        except msgspec.ValidationError:
+            pass
+    return payload
+
+
+def _subscription_type(subscriptions: list[tuple[Any, type | None]]) -> type | None:
+    """Return the payload type of the first typed subscription, if any"""
+    for _, payload_type in subscriptions:
+        if payload_type is not None:
+            return payload_type
+    return None
+
 
 # ==================== Topic Constants ====================
 
@@ -38,6 +134,18 @@ class Topics:
     PLAYER_FINISH_ROLL = "supershow/player/{player_id}/finish_roll"
     PLAYER_BREAKOUT_ROLLS = "supershow/player/{player_id}/breakout_rolls"
 
+    PLAYER_TOPIC_TEMPLATES = (
+        PLAYER_COMPETITOR,
+        PLAYER_HAND_COUNT,
+        PLAYER_DECK_COUNT,
+        PLAYER_DISCARD,
+        PLAYER_IN_PLAY,
+        PLAYER_TURN_ROLL,
+        PLAYER_TURNS_PASSED,
+        PLAYER_FINISH_ROLL,
+        PLAYER_BREAKOUT_ROLLS,
+    )
+
     # Event topics (for match recording)
     EVENT_MATCH_START = "supershow/events/match_start"
     EVENT_TURN_ROLL = "supershow/events/turn_roll"
@@ -52,6 +160,9 @@ class Topics:
     EVENT_CROWD_INCREMENT = "supershow/events/crowd_increment"
     EVENT_MATCH_END = "supershow/events/match_end"
 
+    # Several topic updates in one message (see MQTTClient.publish_batch)
+    BATCH = "supershow/batch"
+
     # Control topics (Production → Controller)
     CONTROL_HEARTBEAT = "supershow/control/heartbeat"
     CONTROL_READY = "supershow/control/ready"
@@ -68,7 +179,133 @@ class Topics:
         Returns:
             Formatted topic string
         """
-        return base_topic.format(player_id=player_id)
+        topic = _PLAYER_TOPICS.get((base_topic, player_id))
+        if topic is None:
+            topic = base_topic.format(player_id=player_id)
+        return topic
+
+
+# Player topics for both players, formatted once so publishing is a dict lookup
+_PLAYER_TOPICS = {
+    (template, player_id): template.format(player_id=player_id)
+    for template in Topics.PLAYER_TOPIC_TEMPLATES
+    for player_id in (1, 2)
+}
+
+
+# ==================== Topic Routing ====================
+
+
+class TopicTrie:
+    """
+    Trie of MQTT topic filters keyed on '/'-separated topic levels
+
+    Supports the '+' (single level) and '#' (all remaining levels) wildcards, so an
+    incoming topic is matched against every stored filter in one walk of its levels.
+    """
+
+    __slots__ = ("children", "plus", "hash_value", "value")
+
+    def __init__(self) -> None:
+        self.children: dict[str, TopicTrie] = {}
+        self.plus: TopicTrie | None = None
+        self.hash_value: Any = None
+        self.value: Any = None
+
+    def insert(self, topic_filter: str, value: Any) -> None:
+        """
+        Store a value for a topic filter, replacing any previous value
+
+        Args:
+            topic_filter: MQTT topic filter (may contain '+' and '#')
+            value: Value returned by match() for topics matching the filter
+        """
+        node = self
+        for level in topic_filter.split("/"):
+            if level == "#":
+                node.hash_value = value
+                return
+            if level == "+":
+                if node.plus is None:
+                    node.plus = TopicTrie()
+                node = node.plus
+            else:
+                child = node.children.get(level)
+                if child is None:
+                    child = node.children[level] = TopicTrie()
+                node = child
+        node.value = value
+
+    def get(self, topic_filter: str) -> Any:
+        """
+        Get the value stored for a topic filter
+
+        Args:
+            topic_filter: MQTT topic filter previously passed to insert()
+
+        Returns:
+            Stored value, or None if the filter has no value
+        """
+        node: TopicTrie | None = self
+        for level in topic_filter.split("/"):
+            if node is None:
+                return None
+            if level == "#":
+                return node.hash_value
+            node = node.plus if level == "+" else node.children.get(level)
+        return None if node is None else node.value
+
+    def remove(self, topic_filter: str) -> None:
+        """
+        Remove the value stored for a topic filter, if any
+
+        Args:
+            topic_filter: MQTT topic filter previously passed to insert()
+        """
+        node: TopicTrie | None = self
+        for level in topic_filter.split("/"):
+            if node is None:
+                return
+            if level == "#":
+                node.hash_value = None
+                return
+            node = node.plus if level == "+" else node.children.get(level)
+        if node is not None:
+            node.value = None
+
+    def match(self, topic: str) -> list[Any]:
+        """
+        Find the values of all filters matching a topic
+
+        Args:
+            topic: Concrete MQTT topic (no wildcards)
+
+        Returns:
+            List of matching values (empty if none)
+        """
+        matches = []
+        nodes = [self]
+        for level in topic.split("/"):
+            next_nodes = []
+            for node in nodes:
+                if node.hash_value is not None:
+                    matches.append(node.hash_value)
+                child = node.children.get(level)
+                if child is not None:
+                    next_nodes.append(child)
+                if node.plus is not None:
+                    next_nodes.append(node.plus)
+            if not next_nodes:
+                return matches
+            nodes = next_nodes
+
+        for node in nodes:
+            if node.value is not None:
+                matches.append(node.value)
+            # 'a/#' also matches 'a' itself
+            if node.hash_value is not None:
+                matches.append(node.hash_value)
+        return matches
 
 
 # ==================== MQTT Client ====================
@@ -87,6 +324,7 @@ class MQTTClient:
         keepalive: int = 60,
         reconnect_delay_min: int = 1,
         reconnect_delay_max: int = 60,
+        use_msgpack: bool = True,
     ):
         """
         Initialize MQTT client
@@ -100,6 +338,7 @@ class MQTTClient:
             keepalive: Keepalive interval in seconds
             reconnect_delay_min: Minimum reconnect delay in seconds
             reconnect_delay_max: Maximum reconnect delay in seconds
+            use_msgpack: Encode structured payloads as MessagePack instead of JSON
         """
         self.client_id = client_id
         self.broker_host = broker_host
@@ -109,25 +348,33 @@ class MQTTClient:
         self.keepalive = keepalive
         self.reconnect_delay_min = reconnect_delay_min
         self.reconnect_delay_max = reconnect_delay_max
+        self.use_msgpack = use_msgpack
 
         # Create client instance
         self.client = mqtt.Client(client_id=client_id)
 
+        # Bound paho methods, looked up once instead of on every call
+        self._publish = self.client.publish
+        self._subscribe = self.client.subscribe
+        self._unsubscribe = self.client.unsubscribe
+
+        # Reconnection with exponential backoff is handled by the network loop
+        self.client.reconnect_delay_set(reconnect_delay_min, reconnect_delay_max)
+
         # Set authentication if provided
         if username and password:
             self.client.username_pw_set(username, password)
 
         # Connection state
         self.connected = False
-        self.reconnect_delay = reconnect_delay_min
 
         # Callback handlers
         self.on_connect_callback: Callable[[bool], None] | None = None
         self.on_disconnect_callback: Callable[[], None] | None = None
         self.on_message_callback: Callable[[str, Any], None] | None = None
 
-        # Message handlers by topic
-        self.topic_handlers: dict[str, Callable[[Any], None]] = {}
+        # (handler, payload_type) by topic filter
+        self.topic_handlers = TopicTrie()
 
         # Set up internal callbacks
         self.client.on_connect = self._on_connect
@@ -165,7 +412,7 @@ class MQTTClient:
 
         Args:
             topic: MQTT topic
-            payload: Message payload (will be JSON-encoded if not string)
+            payload: Message payload (MessagePack/JSON-encoded if not str or bytes)
             qos: Quality of Service (0, 1, or 2)
             retain: Whether to retain message
 
@@ -177,16 +424,77 @@ class MQTTClient:
             return False
 
         try:
-            # Convert payload to JSON if not string
-            if isinstance(payload, str):
-                message = payload
-            else:
-                message = json.dumps(payload)
+            message = self.encode_payload(payload)
+        except Exception as e:
+            logger.error(f"Error publishing to {topic}: {e}")
+            return False
+
+        return self._do_publish(topic, message, qos, retain)
+
+    def publish_raw(
+        self, topic: str, message: bytes | str, qos: int = 0, retain: bool = False
+    ) -> bool:
+        """
+        Publish an already-encoded message to topic
+
+        Use with encode_payload() to encode once when sending the same payload to
+        several topics.
+
+        Args:
+            topic: MQTT topic
+            message: Encoded message, sent as-is
+            qos: Quality of Service (0, 1, or 2)
+            retain: Whether to retain message
+
+        Returns:
+            True if publish was successful
+        """
+        if not self.connected:
+            logger.warning(f"Cannot publish to {topic}: not connected")
+            return False
+
+        return self._do_publish(topic, message, qos, retain)
+
+    def encode_payload(self, payload: Any) -> bytes | str:
+        """
+        Encode a payload the way publish() does
 
-            result = self.client.publish(topic, message, qos=qos, retain=retain)
+        Args:
+            payload: Message payload (MessagePack/JSON-encoded if not str or bytes)
+
+        Returns:
+            Encoded message for publish_raw()
+        """
+        if isinstance(payload, (str, bytes)):
+            return payload
+
+        # Counts, rolls and other immutable values come from a cache; dicts and lists
+        # are encoded every time
+        key = _cache_key(payload)
+        if key is None:
+            return _encode(payload, self.use_msgpack)
+        return _encode_cached(key, payload, self.use_msgpack)
+
+    def _do_publish(self, topic: str, message: bytes | str, qos: int, retain: bool) -> bool:
+        """
+        Hand an encoded message to paho and check the result
+
+        Args:
+            topic: MQTT topic
+            message: Encoded message
+            qos: Quality of Service (0, 1, or 2)
+            retain: Whether to retain message
+
+        Returns:
+            True if publish was successful
+        """
+        try:
+            result = self._publish(topic, message, qos=qos, retain=retain)
 
-            if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                logger.debug(f"Published to {topic}: {message[:100]}")
+            if result.rc == _OK:
+                # Only slice the payload when the debug line will actually be emitted
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Published to %s: %s", topic, message[:100])
                 return True
             else:
                 logger.error(f"Failed to publish to {topic}: {result.rc}")
@@ -196,8 +504,30 @@ class MQTTClient:
             logger.error(f"Error publishing to {topic}: {e}")
             return False
 
+    def publish_batch(self, updates: dict[str, Any], qos: int = 0, retain: bool = False) -> bool:
+        """
+        Publish several topic updates as a single message on Topics.BATCH
+
+        Receiving MQTTClients dispatch each entry to handlers and callbacks as if
+        it had been published on its own topic. Per-field retained state should
+        still be published individually, since only the last batch is retained.
+
+        Args:
+            updates: Mapping of topic to payload (payloads must not be pre-encoded bytes)
+            qos: Quality of Service (0, 1, or 2)
+            retain: Whether to retain message
+
+        Returns:
+            True if publish was successful
+        """
+        return self.publish(Topics.BATCH, updates, qos=qos, retain=retain)
+
     def subscribe(
-        self, topic: str, qos: int = 0, handler: Callable[[Any], None] | None = None
+        self,
+        topic: str,
+        qos: int = 0,
+        handler: Callable[[Any], None] | None = None,
+        payload_type: type | None = None,
     ) -> bool:
         """
         Subscribe to topic
@@ -206,6 +536,7 @@ class MQTTClient:
             topic: MQTT topic (supports wildcards)
             qos: Quality of Service (0, 1, or 2)
             handler: Optional handler function for this topic
+            payload_type: Optional model type (e.g. TurnRoll) to decode payloads into
 
         Returns:
             True if subscription was successful
@@ -215,12 +546,21 @@ class MQTTClient:
             return False
 
         try:
-            result = self.client.subscribe(topic, qos=qos)
+            result = self._subscribe(topic, qos=qos)
 
-            if result[0] == mqtt.MQTT_ERR_SUCCESS:
+            if result[0] == _OK:
                 logger.info(f"Subscribed to {topic}")
-                if handler:
-                    self.topic_handlers[topic] = handler
+                if handler or payload_type is not None:
+                    # Merge with any entry from set_payload_type() or an earlier
+                    # subscribe() rather than overwriting it
+                    old_handler, old_type = self.topic_handlers.get(topic) or (None, None)
+                    self.topic_handlers.insert(
+                        topic,
+                        (
+                            handler or old_handler,
+                            payload_type if payload_type is not None else old_type,
+                        ),
+                    )
                 return True
             else:
                 logger.error(f"Failed to subscribe to {topic}: {result[0]}")
@@ -230,6 +570,20 @@ class MQTTClient:
             logger.error(f"Error subscribing to {topic}: {e}")
             return False
 
+    def set_payload_type(self, topic: str, payload_type: type) -> None:
+        """
+        Decode payloads on matching topics into a model type
+
+        Unlike subscribe(payload_type=...), this does not add a broker subscription,
+        so it can be used for topics already covered by a wildcard subscription.
+
+        Args:
+            topic: MQTT topic filter (supports wildcards)
+            payload_type: Model type (e.g. TurnRoll) to decode payloads into
+        """
+        handler, _ = self.topic_handlers.get(topic) or (None, None)
+        self.topic_handlers.insert(topic, (handler, payload_type))
+
     def unsubscribe(self, topic: str) -> bool:
         """
         Unsubscribe from topic
@@ -241,12 +595,11 @@ class MQTTClient:
             True if unsubscription was successful
         """
         try:
-            result = self.client.unsubscribe(topic)
+            result = self._unsubscribe(topic)
 
-            if result[0] == mqtt.MQTT_ERR_SUCCESS:
+            if result[0] == _OK:
                 logger.info(f"Unsubscribed from {topic}")
-                if topic in self.topic_handlers:
-                    del self.topic_handlers[topic]
+                self.topic_handlers.remove(topic)
                 return True
             else:
                 logger.error(f"Failed to unsubscribe from {topic}: {result[0]}")
@@ -300,7 +653,6 @@ class MQTTClient:
         if rc == 0:
             logger.info("Connected to MQTT broker")
             self.connected = True
-            self.reconnect_delay = self.reconnect_delay_min
 
             if self.on_connect_callback:
                 self.on_connect_callback(True)
@@ -325,18 +677,9 @@ class MQTTClient:
         if rc == 0:
             logger.info("Disconnected from MQTT broker (clean)")
         else:
-            logger.warning(f"Disconnected from MQTT broker (code {rc})")
-
-            # Exponential backoff for reconnection
-            logger.info(f"Reconnecting in {self.reconnect_delay} seconds...")
-            time.sleep(self.reconnect_delay)
-
-            self.reconnect_delay = min(self.reconnect_delay * 2, self.reconnect_delay_max)
-
-            try:
-                self.client.reconnect()
-            except Exception as e:
-                logger.error(f"Reconnection failed: {e}")
+            # paho's network loop reconnects with exponential backoff (see
+            # reconnect_delay_set in __init__), so nothing blocks this callback
+            logger.warning(f"Disconnected from MQTT broker (code {rc}), reconnecting...")
 
         if self.on_disconnect_callback:
             self.on_disconnect_callback()
@@ -351,20 +694,44 @@ class MQTTClient:
             message: MQTT message
         """
         topic = message.topic
-        payload_str = message.payload.decode("utf-8")
+        subscriptions = self.topic_handlers.match(topic)
+        payload = _decode_payload(message.payload, _subscription_type(subscriptions))
 
-        # Try to parse as JSON
-        try:
-            payload = json.loads(payload_str)
-        except json.JSONDecodeError:
-            payload = payload_str
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received message on %s: %.100s", topic, payload)
+
+        if topic == Topics.BATCH and isinstance(payload, dict):
+            self._dispatch_batch(payload)
+        else:
+            self._dispatch(topic, payload, subscriptions)
 
-        logger.debug(f"Received message on {topic}: {str(payload)[:100]}")
+    def _dispatch_batch(self, updates: dict[str, Any]) -> None:
+        """
+        Dispatch each entry of a batch message as if received on its own topic
 
-        # Call topic-specific handler if registered
-        if topic in self.topic_handlers:
+        Args:
+            updates: Decoded mapping of topic to payload
+        """
+        for topic, payload in updates.items():
+            subscriptions = self.topic_handlers.match(topic)
+            payload = _convert_payload(payload, _subscription_type(subscriptions))
+            self._dispatch(topic, payload, subscriptions)
+
+    def _dispatch(self, topic: str, payload: Any, subscriptions: list[Any]) -> None:
+        """
+        Call topic handlers and the global callback for a decoded message
+
+        Args:
+            topic: MQTT topic
+            payload: Decoded payload
+            subscriptions: (handler, payload_type) entries matching the topic
+        """
+        # Call handlers of all matching subscriptions
+        for handler, _ in subscriptions:
+            if handler is None:
+                continue
             try:
-                self.topic_handlers[topic](payload)
+                handler(payload)
             except Exception as e:
                 logger.error(f"Error in topic handler for {topic}: {e}")
 
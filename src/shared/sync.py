@@ -4,18 +4,60 @@ Handles database and image syncing from get-diced.com API
 """
 
 import hashlib
-import json
 import logging
-from collections.abc import Callable
+import mmap
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
+from typing import Any, TypeVar
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .database import DatabaseService
 from .models import CardsManifest, ImageInfo, ImageManifest
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Image downloads are small and latency-bound, so fetch several at once.
+# The connection pool is sized above that so workers never wait on a socket.
+IMAGE_DOWNLOAD_WORKERS = 16
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+
+# Transient failures are retried with backoff instead of failing the image
+HTTP_RETRY = Retry(
+    total=5,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(("GET", "HEAD")),
+)
+
+# Read size when streaming image bodies to disk
+IMAGE_CHUNK_SIZE = 64 * 1024
+
+# Read size when streaming the cards database to disk
+DATABASE_CHUNK_SIZE = 1024 * 1024
+
+# Large database downloads are split into byte ranges fetched in parallel,
+# since CDNs often throttle each connection individually
+DATABASE_RANGE_WORKERS = 8
+DATABASE_RANGE_MIN_SIZE = 8 * 1024 * 1024
+
+# How often a ranged download reports progress while its workers run
+PROGRESS_POLL_INTERVAL = 0.1
+
+# Back-to-back status checks and syncs reuse the images manifest for this long
+IMAGES_MANIFEST_TTL = 30.0
+
 
 class SyncError(Exception):
     """Base exception for sync errors"""
@@ -23,6 +65,34 @@ class SyncError(Exception):
     pass
 
 
+def _preallocate(fd: int, size: int) -> bool:
+    """
+    Reserve disk space for a file about to be written, so large downloads land
+    in few extents instead of growing the file chunk by chunk
+
+    Args:
+        fd: File descriptor opened for writing
+        size: Expected file size in bytes
+
+    Returns:
+        True if the space was reserved (the file now has that size)
+    """
+    if size <= 0 or not hasattr(os, "posix_fallocate"):
+        return False
+
+    try:
+        os.posix_fallocate(fd, 0, size)
+        return True
+    except OSError as e:
+        # Not every filesystem supports it; the write simply proceeds without
+        logger.debug(f"posix_fallocate unavailable: {e}")
+        return False
+
+
+class _RangeNotHonored(Exception):
+    """Raised when the server answers a ranged GET with the full body"""
+
+
 class SyncService:
     """Service for syncing card database and images"""
 
@@ -49,7 +119,8 @@ class SyncService:
             images_base_url: Base path for image downloads
             database_service: Database service instance
             images_path: Local path for storing images
-            local_manifest_path: Path to local manifest file
+            local_manifest_path: Path to a JSON manifest from older versions, imported
+                into the database on first run
             timeout: Request timeout in seconds
         """
         self.api_base_url = api_base_url.rstrip("/")
@@ -63,10 +134,73 @@ class SyncService:
         self.timeout = timeout
 
         self.images_path.mkdir(parents=True, exist_ok=True)
-        self.local_manifest_path.parent.mkdir(parents=True, exist_ok=True)
 
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "BPP-Supershow-Overlay/0.1.0"})
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=HTTP_RETRY,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # url -> (etag, last_modified, parsed manifest) for conditional GETs
+        self._manifest_cache: dict[str, tuple[str | None, str | None, Any]] = {}
+
+        # (monotonic time fetched, manifest) of the last images manifest
+        self._images_manifest_memo: tuple[float, ImageManifest] | None = None
+
+        # UUIDs of images known to be on disk, loaded from the local manifest on
+        # first use by get_image_path
+        self._present_uuids: set[str] | None = None
+
+        self._import_legacy_manifest()
+
+    # ==================== Manifests ====================
+
+    def _fetch_manifest(self, url: str, parse: Callable[[dict[str, Any]], T]) -> T:
+        """
+        Fetch and parse a manifest, revalidating against the last copy
+
+        The ETag / Last-Modified of the previous response are sent back so an
+        unchanged manifest costs a 304 instead of a full download and parse
+
+        Args:
+            url: Manifest URL
+            parse: Callable building the manifest object from decoded JSON
+
+        Returns:
+            Parsed manifest, possibly the cached one
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        cached = self._manifest_cache.get(url)
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if cached and response.status_code == 304:
+            logger.info(f"Manifest not modified: {url}")
+            manifest: T = cached[2]
+            return manifest
+        response.raise_for_status()
+
+        # orjson on the raw body skips requests' charset detection and stdlib json
+        manifest = parse(orjson.loads(response.content))
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._manifest_cache[url] = (etag, last_modified, manifest)
+
+        return manifest
 
     # ==================== Database Sync ====================
 
@@ -84,30 +218,43 @@ class SyncService:
         logger.info(f"Fetching cards manifest from: {url}")
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
-
-            return CardsManifest(
-                version=data["version"],
-                filename=data["filename"],
-                size_bytes=data["size_bytes"],
-                generated=data["generated"],
-            )
+            return self._fetch_manifest(url, self._parse_cards_manifest)
         except requests.RequestException as e:
             raise SyncError(f"Failed to fetch cards manifest: {e}") from e
 
+    @staticmethod
+    def _parse_cards_manifest(data: dict[str, Any]) -> CardsManifest:
+        """
+        Build a CardsManifest from decoded manifest JSON
+
+        Args:
+            data: Decoded manifest JSON
+
+        Returns:
+            CardsManifest object
+        """
+        return CardsManifest(
+            version=data["version"],
+            filename=data["filename"],
+            size_bytes=data["size_bytes"],
+            generated=data["generated"],
+        )
+
     def download_cards_database(
-        self, progress_callback: Callable[[int, int], None] | None = None
-    ) -> bytes:
+        self, dest_path: Path, progress_callback: Callable[[int, int], None] | None = None
+    ) -> int:
         """
-        Download cards database from API
+        Download cards database from API straight to a file
+
+        Uses parallel ranged GETs when the server supports them, otherwise a
+        single streamed GET
 
         Args:
+            dest_path: File to write the database to
             progress_callback: Optional callback(downloaded_bytes, total_bytes)
 
         Returns:
-            Database file content as bytes
+            Number of bytes written
 
         Raises:
             SyncError: If download fails
@@ -116,25 +263,170 @@ class SyncService:
         logger.info(f"Downloading database from: {url}")
 
         try:
-            response = self.session.get(url, timeout=self.timeout, stream=True)
+            total_size = self._get_range_download_size(url)
+            if total_size:
+                try:
+                    return self._download_ranges(url, dest_path, total_size, progress_callback)
+                except _RangeNotHonored:
+                    logger.info("Server ignored range request, falling back to single stream")
+
+            return self._download_stream(url, dest_path, progress_callback)
+
+        except requests.RequestException as e:
+            raise SyncError(f"Failed to download database: {e}") from e
+
+    def _get_range_download_size(self, url: str) -> int:
+        """
+        Check whether a file can be downloaded in parallel byte ranges
+
+        Args:
+            url: File URL
+
+        Returns:
+            File size in bytes, or 0 if ranged download should not be used
+        """
+        if not hasattr(os, "pwrite"):
+            return 0
+
+        # Ask for the identity encoding so byte offsets match the file on disk
+        response = self.session.head(
+            url,
+            headers={"Accept-Encoding": "identity"},
+            timeout=self.timeout,
+            allow_redirects=True,
+        )
+        if not response.ok or response.headers.get("accept-ranges", "").lower() != "bytes":
+            return 0
+
+        total_size = int(response.headers.get("content-length", 0))
+        if total_size < DATABASE_RANGE_MIN_SIZE:
+            return 0
+        return total_size
+
+    def _download_stream(
+        self,
+        url: str,
+        dest_path: Path,
+        progress_callback: Callable[[int, int], None] | None,
+    ) -> int:
+        """
+        Download a file with a single streamed GET
+
+        Args:
+            url: File URL
+            dest_path: File to write to
+            progress_callback: Optional callback(downloaded_bytes, total_bytes)
+
+        Returns:
+            Number of bytes written
+        """
+        with self.session.get(url, timeout=self.timeout, stream=True) as response:
             response.raise_for_status()
 
             total_size = int(response.headers.get("content-length", 0))
             downloaded = 0
-            chunks = []
 
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    chunks.append(chunk)
+            with open(dest_path, "wb") as f:
+                _preallocate(f.fileno(), total_size)
+
+                for chunk in response.iter_content(chunk_size=DATABASE_CHUNK_SIZE):
+                    f.write(chunk)
                     downloaded += len(chunk)
 
                     if progress_callback and total_size:
                         progress_callback(downloaded, total_size)
 
-            return b"".join(chunks)
+                # Content-Length is only a hint (it's the compressed size when the
+                # body is encoded), so drop any preallocated space left unused
+                f.truncate(downloaded)
 
-        except requests.RequestException as e:
-            raise SyncError(f"Failed to download database: {e}") from e
+        return downloaded
+
+    def _download_ranges(
+        self,
+        url: str,
+        dest_path: Path,
+        total_size: int,
+        progress_callback: Callable[[int, int], None] | None,
+    ) -> int:
+        """
+        Download a file as parallel byte ranges written in place
+
+        Args:
+            url: File URL
+            dest_path: File to write to
+            total_size: File size in bytes
+            progress_callback: Optional callback(downloaded_bytes, total_bytes)
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            _RangeNotHonored: If the server returns the full body for a range
+            SyncError: If a range comes back short
+        """
+        part_size = -(-total_size // DATABASE_RANGE_WORKERS)
+        ranges = [
+            (start, min(start + part_size, total_size) - 1)
+            for start in range(0, total_size, part_size)
+        ]
+
+        lock = threading.Lock()
+        downloaded = 0
+
+        def fetch_range(fd: int, start: int, end: int) -> None:
+            nonlocal downloaded
+            headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+
+            with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as r:
+                r.raise_for_status()
+                if r.status_code != 206:
+                    raise _RangeNotHonored()
+
+                offset = start
+                for chunk in r.iter_content(chunk_size=DATABASE_CHUNK_SIZE):
+                    view = memoryview(chunk)
+                    while view:
+                        written = os.pwrite(fd, view, offset)
+                        offset += written
+                        view = view[written:]
+
+                    with lock:
+                        downloaded += len(chunk)
+
+            if offset != end + 1:
+                raise SyncError(f"Short read for bytes {start}-{end}: got {offset - start}")
+
+        with open(dest_path, "wb") as f:
+            fd = f.fileno()
+            if not _preallocate(fd, total_size):
+                f.truncate(total_size)
+
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [executor.submit(fetch_range, fd, start, end) for start, end in ranges]
+                pending = set(futures)
+                reported = 0
+
+                # Workers only count bytes; progress is reported from this thread
+                # so UI callbacks never run on a pool thread
+                try:
+                    while pending:
+                        done, pending = wait(
+                            pending, timeout=PROGRESS_POLL_INTERVAL, return_when=FIRST_EXCEPTION
+                        )
+                        for future in done:
+                            future.result()
+
+                        if progress_callback and downloaded != reported:
+                            reported = downloaded
+                            progress_callback(reported, total_size)
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        logger.debug(f"Downloaded {total_size} bytes in {len(ranges)} ranges")
+        return total_size
 
     def sync_database(
         self, current_version: int, progress_callback: Callable[[str, float], None] | None = None
@@ -180,21 +472,20 @@ class SyncService:
                     progress,
                 )
 
-        db_data = self.download_cards_database(download_progress)
+        temp_path = self.database_service.db_path.parent / "cards_temp.db"
 
-        # Step 3: Save to temp file
-        if progress_callback:
-            progress_callback("Installing database...", 0.7)
+        try:
+            # Step 3: Download straight to the temp file
+            size = self.download_cards_database(temp_path, download_progress)
+            logger.info(f"Saved temp database to: {temp_path} ({size} bytes)")
 
-        temp_path = self.database_service.db_path.parent / "cards_temp.db"
-        temp_path.write_bytes(db_data)
-        logger.info(f"Saved temp database to: {temp_path}")
+            if progress_callback:
+                progress_callback("Installing database...", 0.7)
 
-        # Step 4: Replace database
-        if progress_callback:
-            progress_callback("Replacing card data...", 0.8)
+            # Step 4: Replace database
+            if progress_callback:
+                progress_callback("Replacing card data...", 0.8)
 
-        try:
             counts = self.database_service.replace_from_temp_db(str(temp_path))
             logger.info(
                 f"Database updated: {counts[0]} cards, {counts[1]} finishes, {counts[2]} related"
@@ -222,60 +513,81 @@ class SyncService:
         Raises:
             SyncError: If request fails
         """
+        memo = self._images_manifest_memo
+        if memo and time.monotonic() - memo[0] < IMAGES_MANIFEST_TTL:
+            return memo[1]
+
         url = f"{self.api_base_url}{self.images_manifest_url}"
         logger.info(f"Fetching images manifest from: {url}")
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
-
-            images = {}
-            for uuid, info in data.get("images", {}).items():
-                images[uuid] = ImageInfo(hash=info["hash"], path=info["path"])
-
-            return ImageManifest(
-                version=data["version"],
-                generated=data["generated"],
-                image_count=data["image_count"],
-                images=images,
-            )
+            manifest = self._fetch_manifest(url, self._parse_images_manifest)
         except requests.RequestException as e:
             raise SyncError(f"Failed to fetch images manifest: {e}") from e
 
-    def load_local_manifest(self) -> ImageManifest | None:
+        self._images_manifest_memo = (time.monotonic(), manifest)
+        return manifest
+
+    @staticmethod
+    def _parse_images_manifest(data: dict[str, Any]) -> ImageManifest:
         """
-        Load local images manifest
+        Build an ImageManifest from decoded manifest JSON
+
+        Args:
+            data: Decoded manifest JSON
 
         Returns:
-            ImageManifest or None if not found
+            ImageManifest object
+        """
+        images = {}
+        for uuid, info in data.get("images", {}).items():
+            images[sys.intern(uuid)] = ImageInfo(hash=info["hash"], path=info["path"])
+
+        return ImageManifest(
+            version=data["version"],
+            generated=data["generated"],
+            image_count=data["image_count"],
+            images=images,
+        )
+
+    def _import_legacy_manifest(self) -> None:
+        """
+        Move a local JSON manifest from older versions into the database
+
+        The file is renamed afterwards so the import only happens once
         """
         if not self.local_manifest_path.exists():
-            logger.info("No local manifest found")
-            return None
+            return
 
         try:
-            with open(self.local_manifest_path) as f:
-                data = json.load(f)
-
-            images = {}
-            for uuid, info in data.get("images", {}).items():
-                images[uuid] = ImageInfo(hash=info["hash"], path=info["path"])
-
-            manifest = ImageManifest(
-                version=data["version"],
-                generated=data["generated"],
-                image_count=data["image_count"],
-                images=images,
+            data = orjson.loads(self.local_manifest_path.read_bytes())
+            manifest = self._parse_images_manifest(data)
+            self.database_service.upsert_images(
+                manifest.images, manifest.version, manifest.generated
             )
-
-            logger.info(f"Loaded local manifest: {manifest.image_count} images")
-            return manifest
+            self.local_manifest_path.replace(
+                self.local_manifest_path.with_name(f"{self.local_manifest_path.name}.imported")
+            )
+            logger.info(f"Imported local manifest: {len(manifest.images)} images")
 
         except Exception as e:
-            logger.error(f"Failed to load local manifest: {e}")
+            logger.error(f"Failed to import local manifest: {e}")
+
+    def load_local_manifest(self) -> ImageManifest | None:
+        """
+        Load local images manifest
+
+        Returns:
+            ImageManifest or None if not found
+        """
+        manifest = self.database_service.get_image_manifest()
+        if manifest is None:
+            logger.info("No local manifest found")
             return None
 
+        logger.info(f"Loaded local manifest: {manifest.image_count} images")
+        return manifest
+
     def save_local_manifest(self, manifest: ImageManifest) -> None:
         """
         Save local images manifest
@@ -283,19 +595,7 @@ class SyncService:
         Args:
             manifest: ImageManifest to save
         """
-        data = {
-            "version": manifest.version,
-            "generated": manifest.generated,
-            "image_count": manifest.image_count,
-            "images": {
-                uuid: {"hash": info.hash, "path": info.path}
-                for uuid, info in manifest.images.items()
-            },
-        }
-
-        with open(self.local_manifest_path, "w") as f:
-            json.dump(data, f, indent=2)
-
+        self.database_service.save_image_manifest(manifest)
         logger.info(f"Saved local manifest: {manifest.image_count} images")
 
     def get_local_image_hashes(self) -> dict[str, str]:
@@ -305,11 +605,7 @@ class SyncService:
         Returns:
             Dict of {uuid: hash}
         """
-        manifest = self.load_local_manifest()
-        if not manifest:
-            return {}
-
-        return {uuid: info.hash for uuid, info in manifest.images.items()}
+        return self.database_service.get_image_hashes()
 
     def download_image(self, uuid: str, path: str, verify_hash: str | None = None) -> Path:
         """
@@ -329,26 +625,44 @@ class SyncService:
         url = f"{self.api_base_url}{self.images_base_url}/{path}"
         logger.debug(f"Downloading image: {uuid} from {url}")
 
+        # Save to local path: images/{first_2_chars}/{uuid}.webp; sync_images
+        # creates the prefix directories up front
+        img_path = self.images_path / uuid[:2] / f"{uuid}.webp"
+        part_path = img_path.with_name(f"{img_path.name}.part")
+
+        # Integrity check only, which lets OpenSSL use its fastest path
+        hasher = hashlib.new("sha256", usedforsecurity=False) if verify_hash else None
+
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            image_data = response.content
+            # Stream straight to disk so memory stays flat however large the image
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+
+                try:
+                    f = open(part_path, "wb")
+                except FileNotFoundError:
+                    # Called outside sync_images before the prefix directory exists
+                    img_path.parent.mkdir(parents=True, exist_ok=True)
+                    f = open(part_path, "wb")
+
+                with f:
+                    for chunk in response.iter_content(chunk_size=IMAGE_CHUNK_SIZE):
+                        f.write(chunk)
+                        if hasher:
+                            hasher.update(chunk)
 
             # Verify hash if provided
-            if verify_hash:
-                actual_hash = hashlib.sha256(image_data).hexdigest()
+            if hasher:
+                actual_hash = hasher.hexdigest()
                 if actual_hash != verify_hash:
                     raise SyncError(
                         f"Image hash mismatch for {uuid}: expected {verify_hash}, got {actual_hash}"
                     )
 
-            # Save to local path: images/{first_2_chars}/{uuid}.webp
-            first_2 = uuid[:2]
-            img_dir = self.images_path / first_2
-            img_dir.mkdir(parents=True, exist_ok=True)
-
-            img_path = img_dir / f"{uuid}.webp"
-            img_path.write_bytes(image_data)
+            # Atomic rename so a crash never leaves a half-written image behind
+            os.replace(part_path, img_path)
+            if self._present_uuids is not None:
+                self._present_uuids.add(uuid)
 
             logger.debug(f"Saved image to: {img_path}")
             return img_path
@@ -356,6 +670,103 @@ class SyncService:
         except requests.RequestException as e:
             raise SyncError(f"Failed to download image {uuid}: {e}") from e
 
+        except OSError as e:
+            raise SyncError(f"Failed to save image {uuid}: {e}") from e
+
+        finally:
+            part_path.unlink(missing_ok=True)
+
+    def _hash_local_image(self, uuid: str) -> str | None:
+        """
+        Hash an image file already on disk
+
+        Args:
+            uuid: Image UUID
+
+        Returns:
+            SHA256 hex digest, or None if the file can't be read
+        """
+        img_path = self.images_path / uuid[:2] / f"{uuid}.webp"
+        hasher = hashlib.new("sha256", usedforsecurity=False)
+
+        try:
+            with open(img_path, "rb") as f:
+                # mmap can't map empty files; their hash is the empty digest
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        hasher.update(mapped)
+        except (OSError, ValueError):
+            return None
+
+        return hasher.hexdigest()
+
+    def _reconcile_local_images(
+        self, to_sync: dict[str, ImageInfo], server_manifest: ImageManifest
+    ) -> dict[str, ImageInfo]:
+        """
+        Record images that are already on disk with the server's hash, e.g. after
+        the local manifest was lost, instead of downloading them again
+
+        Args:
+            to_sync: Dict of {uuid: ImageInfo} the local manifest says are needed
+            server_manifest: Images manifest from the server
+
+        Returns:
+            Dict of {uuid: ImageInfo} that still need downloading
+        """
+        # hashlib releases the GIL on large buffers, so threads hash in parallel
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+            local_hashes = executor.map(self._hash_local_image, to_sync)
+            current = {
+                uuid: info
+                for (uuid, info), local_hash in zip(to_sync.items(), local_hashes, strict=True)
+                if local_hash == info.hash
+            }
+
+        if not current:
+            return to_sync
+
+        self.database_service.upsert_images(
+            current, server_manifest.version, server_manifest.generated
+        )
+        logger.info(f"Found {len(current)} current images already on disk")
+
+        return {uuid: info for uuid, info in to_sync.items() if uuid not in current}
+
+    def _ensure_prefix_dirs(self, uuids: Iterable[str]) -> None:
+        """
+        Create the images/{first_2_chars} directories for a batch of images once,
+        rather than checking for them on every download
+
+        Args:
+            uuids: Image UUIDs about to be downloaded
+        """
+        for prefix in {uuid[:2] for uuid in uuids}:
+            (self.images_path / prefix).mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _find_images_to_sync(
+        server_manifest: ImageManifest, local_hashes: dict[str, str]
+    ) -> dict[str, ImageInfo]:
+        """
+        Find server images that are missing locally or whose hash changed
+
+        Args:
+            server_manifest: Images manifest from the server
+            local_hashes: Dict of {uuid: hash} for downloaded images
+
+        Returns:
+            Dict of {uuid: ImageInfo} to download
+        """
+        # A single comprehension with a bound get beats keys()/& set algebra
+        # here, which has to build intermediate sets and look every key up again
+        local_get = local_hashes.get
+        return {
+            uuid: info
+            for uuid, info in server_manifest.images.items()
+            if local_get(uuid) != info.hash
+        }
+
     def sync_images(
         self, progress_callback: Callable[[int, int], None] | None = None
     ) -> tuple[int, int]:
@@ -373,20 +784,19 @@ class SyncService:
         """
         logger.info("Starting image sync...")
 
-        # Get server manifest
+        # Get server manifest; the memo is dropped so the next status check after
+        # this sync asks the server again
         server_manifest = self.get_images_manifest()
+        self._images_manifest_memo = None
         logger.info(f"Server manifest: {server_manifest.image_count} images")
 
         # Get local hashes
         local_hashes = self.get_local_image_hashes()
         logger.info(f"Local hashes: {len(local_hashes)} images")
 
-        # Find images to sync
-        to_sync = []
-        for uuid, server_info in server_manifest.images.items():
-            local_hash = local_hashes.get(uuid)
-            if local_hash is None or local_hash != server_info.hash:
-                to_sync.append((uuid, server_info))
+        # Find images to sync, skipping any already on disk with the right hash
+        to_sync = self._find_images_to_sync(server_manifest, local_hashes)
+        to_sync = self._reconcile_local_images(to_sync, server_manifest)
 
         total = len(to_sync)
         logger.info(f"Images to sync: {total}")
@@ -394,41 +804,42 @@ class SyncService:
         if total == 0:
             return (0, 0)
 
-        # Download images
+        self._ensure_prefix_dirs(to_sync)
+
+        # Download images in parallel; results are collected on this thread,
+        # so the counters and progress callback need no extra locking
         downloaded = 0
-        synced_images = {}
-
-        for uuid, server_info in to_sync:
-            try:
-                self.download_image(uuid, server_info.path, verify_hash=server_info.hash)
-                synced_images[uuid] = server_info
-                downloaded += 1
-
-                if progress_callback:
-                    progress_callback(downloaded, total)
-
-            except SyncError as e:
-                logger.error(f"Failed to sync image {uuid}: {e}")
-
-        # Update local manifest
-        if synced_images:
-            local_manifest = self.load_local_manifest()
-            if local_manifest:
-                # Merge with existing
-                local_manifest.images.update(synced_images)
-                local_manifest.version = server_manifest.version
-                local_manifest.generated = server_manifest.generated
-                local_manifest.image_count = len(local_manifest.images)
-            else:
-                # Create new with only synced images
-                local_manifest = ImageManifest(
-                    version=server_manifest.version,
-                    generated=server_manifest.generated,
-                    image_count=len(synced_images),
-                    images=synced_images,
+
+        with ThreadPoolExecutor(max_workers=IMAGE_DOWNLOAD_WORKERS) as executor:
+            futures = {}
+            for uuid, server_info in to_sync.items():
+                future = executor.submit(
+                    self.download_image, uuid, server_info.path, verify_hash=server_info.hash
                 )
+                futures[future] = (uuid, server_info)
+
+            for future in as_completed(futures):
+                uuid, server_info = futures[future]
+                try:
+                    future.result()
+                    downloaded += 1
+
+                    # Record each image as soon as it is verified, so an
+                    # interrupted sync resumes with only the missing images
+                    self.database_service.upsert_images(
+                        {uuid: server_info}, server_manifest.version, server_manifest.generated
+                    )
 
-            self.save_local_manifest(local_manifest)
+                    if progress_callback:
+                        progress_callback(downloaded, total)
+
+                except SyncError as e:
+                    logger.error(f"Failed to sync image {uuid}: {e}")
+
+                except Exception as e:
+                    # Keep collecting the rest of the batch; leaving the loop would
+                    # discard downloads the other workers are still finishing
+                    logger.error(f"Unexpected error syncing image {uuid}: {e}")
 
         logger.info(f"Image sync complete: {downloaded}/{total} downloaded")
         return (downloaded, total)
@@ -443,10 +854,18 @@ class SyncService:
         Returns:
             Path to image file or None if not found
         """
-        first_2 = uuid[:2]
-        img_path = self.images_path / first_2 / f"{uuid}.webp"
+        img_path = self.images_path / uuid[:2] / f"{uuid}.webp"
+
+        # Called from render paths, so answer known images from memory and only
+        # stat the file for images the manifest doesn't list
+        present = self._present_uuids
+        if present is None:
+            present = self._present_uuids = set(self.database_service.get_image_hashes())
 
+        if uuid in present:
+            return img_path
         if img_path.exists():
+            present.add(uuid)
             return img_path
         return None
 
@@ -463,10 +882,5 @@ class SyncService:
         server_manifest = self.get_images_manifest()
         local_hashes = self.get_local_image_hashes()
 
-        need_sync = 0
-        for uuid, server_info in server_manifest.images.items():
-            local_hash = local_hashes.get(uuid)
-            if local_hash is None or local_hash != server_info.hash:
-                need_sync += 1
-
+        need_sync = len(self._find_images_to_sync(server_manifest, local_hashes))
         return (need_sync, server_manifest.image_count)
@@ -6,19 +6,28 @@ to verify that all state changes are being published correctly.
 """
 
 import logging
+import signal
+import threading
+from collections import deque
+from typing import Any
 
 from src.shared.mqtt_client import MQTTClient
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
 logger = logging.getLogger(__name__)
 
-received_messages = []
+# Only the most recent messages are kept so a long-running monitor stays bounded;
+# total_received counts every message
+received_messages: deque[tuple[str, Any]] = deque(maxlen=10_000)
+total_received = 0
 
 
 def on_message(topic: str, payload):
     """Callback for received messages."""
+    global total_received
     logger.info(f"📨 {topic}: {payload}")
     received_messages.append((topic, payload))
+    total_received += 1
 
 
 def main():
@@ -40,16 +49,15 @@ def main():
     logger.info("=" * 60)
     logger.info("")
 
-    try:
-        # Keep running
-        import time
+    # Sleep until Ctrl+C (or a termination request) instead of polling
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    stop.wait()
 
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        logger.info("\n\nReceived Ctrl+C, shutting down...")
-        mqtt.disconnect()
-        logger.info(f"Total messages received: {len(received_messages)}")
+    logger.info("\n\nReceived Ctrl+C, shutting down...")
+    mqtt.disconnect()
+    logger.info(f"Total messages received: {total_received} ({len(received_messages)} kept)")
 
 
 if __name__ == "__main__":